@@ -0,0 +1,15 @@
+-- 0003_indexes.sql — Rev 1.1.1
+-- Lookup indexes for the overview aggregates and the subtask views.
+-- Assumes 0001_init.sql (Rev 1.1.0) has been applied.
+
+BEGIN;
+
+-- tasks: per-project phase counts (WHERE project_id = ? GROUP BY phase_id) read the index only
+CREATE INDEX IF NOT EXISTS idx_tasks_project_id_phase_id
+  ON tasks(project_id, phase_id);
+
+-- subtasks: tasks → subtasks joins and per-task counts
+CREATE INDEX IF NOT EXISTS idx_subtasks_task_id
+  ON subtasks(task_id);
+
+COMMIT;
@@ -1,6 +1,7 @@
 # Rev 0.6.8
 
 # src/main.py  (Rev 0.6.8)
+import logging
 import sys
 from PySide6.QtGui import QGuiApplication, QFont
 from PySide6.QtCore import Qt, QCoreApplication
@@ -35,7 +36,8 @@ def main():
     QCoreApplication.setApplicationName("trackerZ")
     
     logfile = setup_logging("trackerZ")
-    print(f"[logging] Writing to: {logfile}")  # also lands in run.sh tee
+    # setup_logging already reports the file at INFO on the console handler (run.sh tee)
+    logging.getLogger("trackerZ").debug("Writing to: %s", logfile)
     # --- DI wiring ---
     projects_repo, tasks_repo, subtasks_repo, phases_repo = _build_repositories(DB_PATH)
 
@@ -2,7 +2,7 @@
 """Lightweight entities aligned with schema Rev 0.6.8 (phase_id + priority_id)"""
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, NamedTuple, Mapping, Any
 
 
 @dataclass
@@ -32,3 +32,37 @@ class Subtask:
     description: Optional[str] = None
     phase_id: int = 1          # existing
     priority_id: int = 2       # new: NOT NULL in DB (default Medium)
+
+
+class HistoryUpdate(NamedTuple):
+    """One decorated timeline row (task or subtask update) as shown by HistoryPanel."""
+    updated_local: str = ""
+    updated_at_utc: str = ""
+    reason: str = "update"
+    old_phase_id: Optional[int] = None
+    new_phase_id: Optional[int] = None
+    old_phase_name: str = ""
+    new_phase_name: str = ""
+    old_priority_id: Optional[int] = None
+    new_priority_id: Optional[int] = None
+    old_priority_name: str = ""
+    new_priority_name: str = ""
+    note: str = ""
+
+    @classmethod
+    def from_dict(cls, d: Mapping[str, Any]) -> "HistoryUpdate":
+        g = d.get
+        return cls(
+            g("updated_local") or "",
+            g("updated_at_utc") or "",
+            g("reason") or "update",
+            g("old_phase_id"),
+            g("new_phase_id"),
+            g("old_phase_name") or "",
+            g("new_phase_name") or "",
+            g("old_priority_id"),
+            g("new_priority_id"),
+            g("old_priority_name") or "",
+            g("new_priority_name") or "",
+            g("note") or "",
+        )
@@ -4,6 +4,7 @@
 - WAL mode, foreign_keys=ON
 - Applies SQL files in data/migrations in lexical order
 - Tracks applied files in schema_migrations(filename TEXT PRIMARY KEY, applied_at UTC)
+- Database.conn belongs to the GUI thread; QThreadPool jobs open their own with connect()
 """
 from __future__ import annotations
 import sqlite3
@@ -61,3 +62,40 @@ class Database:
     # Convenience cursor
     def cursor(self) -> sqlite3.Cursor:
         return self.conn.cursor()
+
+
+
+
+def database_path(source) -> str:
+    """
+    File behind a sqlite3.Connection, a Database, or a SQLite repository ("" for in-memory/temp).
+    Call it on the thread that owns the shared connection (the GUI thread), e.g. when a job is built.
+    """
+    conn = source
+    if not isinstance(conn, sqlite3.Connection):
+        try:
+            conn = source._conn()
+        except Exception:
+            conn = getattr(source, "conn", None)
+    if not isinstance(conn, sqlite3.Connection):
+        return ""
+    try:
+        return next((r[2] for r in conn.execute("PRAGMA database_list") if r[1] == "main"), "") or ""
+    except sqlite3.Error:
+        return ""
+
+
+
+
+def connect(path: Path | str, *, readonly: bool = False) -> sqlite3.Connection:
+    """
+    A connection for one worker job, set up like Database.conn (autocommit, foreign keys).
+    Open and close it on the worker thread: its transactions never mix with the GUI's.
+    """
+    if readonly:
+        conn = sqlite3.connect(f"{Path(path).as_uri()}?mode=ro", uri=True, isolation_level=None)
+        conn.execute("PRAGMA query_only=1;")
+    else:
+        conn = sqlite3.connect(path, isolation_level=None)
+        conn.execute("PRAGMA foreign_keys=ON;")
+    return conn
@@ -16,8 +16,8 @@ class SQLitePhaseRepository:
 
     def __init__(self, db):
         """
-        `db` is your Database wrapper (repositories/db.py).
-        It may expose either `.conn` (sqlite3.Connection) or a `.connect()` method.
+        `db` is your Database wrapper (repositories/db.py) or a raw sqlite3.Connection.
+        A wrapper may expose either `.conn` (sqlite3.Connection) or a `.connect()` method.
         """
         self._db = db
 
@@ -41,7 +41,9 @@ class SQLitePhaseRepository:
     # --- internals ----------------------------------------------------------
 
     def _conn(self) -> sqlite3.Connection:
-        # Support either a direct .conn attribute or a .connect() method on your db wrapper
+        # A raw sqlite3.Connection, or a wrapper with a .conn attribute / .connect() method
+        if isinstance(self._db, sqlite3.Connection):
+            return self._db
         if hasattr(self._db, "conn") and isinstance(self._db.conn, sqlite3.Connection):
             return self._db.conn
         if hasattr(self._db, "connect"):
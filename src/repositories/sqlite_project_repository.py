@@ -49,6 +49,51 @@ class SQLiteProjectRepository:
         rows = self._fetch_all(sql, (project_id,))
         return rows[0] if rows else None
 
+    def get_project_overview(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Everything the project overview shows, in one statement:
+        get_project() + created/updated timestamps (updated falls back to created
+        until the project has an update), tasks_total, tasks_phase_1..5 (task count
+        per phase, from one grouped pass over the project's tasks) and subtasks_total.
+        """
+        sql = """
+            SELECT
+                p.id,
+                p.name,
+                p.description,
+                p.phase_id,
+                p.priority_id,
+                p.created_at_utc,
+                COALESCE((SELECT MAX(u.updated_at_utc) FROM project_updates u
+                           WHERE u.project_id = p.id), p.created_at_utc) AS updated_at_utc,
+                COALESCE(tc.tasks_total, 0)   AS tasks_total,
+                COALESCE(tc.tasks_phase_1, 0) AS tasks_phase_1,
+                COALESCE(tc.tasks_phase_2, 0) AS tasks_phase_2,
+                COALESCE(tc.tasks_phase_3, 0) AS tasks_phase_3,
+                COALESCE(tc.tasks_phase_4, 0) AS tasks_phase_4,
+                COALESCE(tc.tasks_phase_5, 0) AS tasks_phase_5,
+                (SELECT COUNT(1) FROM subtasks s
+                   JOIN tasks t ON t.id = s.task_id
+                  WHERE t.project_id = p.id) AS subtasks_total
+            FROM projects p
+            LEFT JOIN (
+                SELECT
+                    project_id,
+                    COUNT(1)          AS tasks_total,
+                    SUM(phase_id = 1) AS tasks_phase_1,
+                    SUM(phase_id = 2) AS tasks_phase_2,
+                    SUM(phase_id = 3) AS tasks_phase_3,
+                    SUM(phase_id = 4) AS tasks_phase_4,
+                    SUM(phase_id = 5) AS tasks_phase_5
+                FROM tasks
+                WHERE project_id = ?
+                GROUP BY project_id
+            ) tc ON tc.project_id = p.id
+            WHERE p.id = ?;
+        """
+        rows = self._fetch_all(sql, (project_id, project_id))
+        return rows[0] if rows else None
+
     # ---------- internals ----------
 
     def _conn(self) -> sqlite3.Connection:
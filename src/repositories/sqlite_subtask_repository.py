@@ -1,7 +1,13 @@
 # Rev 0.6.8
 from __future__ import annotations
 import sqlite3
-from typing import Any, Dict, List, Optional, Tuple, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+def _utc_now() -> str:
+    """Same text as SQLite's datetime('now'); one value shared by a call's rows."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
 
 
 class SQLiteSubtaskRepository:
@@ -55,14 +61,15 @@ class SQLiteSubtaskRepository:
     ) -> int:
         con = self._conn()
         cur = con.cursor()
+        now = _utc_now()
 
         # insert subtask
         cur.execute(
             """
             INSERT INTO subtasks(task_id, name, description, phase_id, priority_id, created_at_utc, updated_at_utc)
-            VALUES (?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+            VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
-            (task_id, name, description or '', phase_id, priority_id),
+            (task_id, name, description or '', phase_id, priority_id, now, now),
         )
         sub_id = cur.lastrowid
 
@@ -72,9 +79,9 @@ class SQLiteSubtaskRepository:
             INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                         old_phase_id, new_phase_id,
                                         old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, 'create', 1, ?, ?, ?)
+            VALUES (?, ?, ?, 'create', 1, ?, ?, ?)
             """,
-            (sub_id, note_on_create, phase_id, priority_id, priority_id),
+            (sub_id, now, note_on_create, phase_id, priority_id, priority_id),
         )
 
         # Mirror lightweight note into parent task's timeline
@@ -83,9 +90,9 @@ class SQLiteSubtaskRepository:
             INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                      old_phase_id, new_phase_id,
                                      old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, 'subtask_create', 1, ?, 2, ?)
+            VALUES (?, ?, ?, 'subtask_create', 1, ?, 2, ?)
             """,
-            (task_id, f"[subtask #{sub_id}] {note_on_create or 'created'}", phase_id, priority_id),
+            (task_id, now, f"[subtask #{sub_id}] {note_on_create or 'created'}", phase_id, priority_id),
         )
 
         con.commit()
@@ -105,6 +112,41 @@ class SQLiteSubtaskRepository:
         row = cur.fetchone()
         return self._row_to_dict(row) if row else None
 
+    def get_subtask_with_history(
+        self, subtask_id: int, *, limit: int = 200
+    ) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        (subtask, updates newest-first) in one call, for the edit dialog + timeline.
+        Updates match SQLiteSubtaskUpdatesRepository.list_updates_for_subtask(order_desc=True).
+        """
+        con = self._conn()
+        cur = con.cursor()
+        cur.execute(
+            """
+            SELECT id, task_id, name, description, phase_id, priority_id, created_at_utc, updated_at_utc
+            FROM subtasks
+            WHERE id = ?
+            """,
+            (subtask_id,),
+        )
+        row = cur.fetchone()
+        if not row:
+            return None, []
+        cur.execute(
+            """
+            SELECT id, subtask_id, updated_at_utc, note, reason,
+                   old_phase_id, new_phase_id, old_priority_id, new_priority_id
+            FROM subtask_updates
+            WHERE subtask_id = ?
+            ORDER BY datetime(updated_at_utc) DESC, id DESC
+            LIMIT ?
+            """,
+            (subtask_id, limit),
+        )
+        cols = [d[0] for d in cur.description]
+        updates = [dict(zip(cols, r)) for r in cur.fetchall()]
+        return self._row_to_dict(row), updates
+
     def update_subtask_fields(
         self,
         subtask_id: int,
@@ -112,17 +154,12 @@ class SQLiteSubtaskRepository:
         name: Optional[str] = None,
         description: Optional[str] = None,
         note: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> bool:
-        con = self._conn()
+        # conn: caller-owned transaction (apply_subtask_changes); it commits, not us
+        con = conn or self._conn()
         cur = con.cursor()
-
-        # Need parent task_id + current priority_id
-        cur.execute("SELECT task_id, priority_id FROM subtasks WHERE id = ?", (subtask_id,))
-        r = cur.fetchone()
-        if not r:
-            return False
-        task_id = r["task_id"] if isinstance(r, sqlite3.Row) else r[0]
-        priority_id = r["priority_id"] if isinstance(r, sqlite3.Row) else r[1]
+        now = _utc_now()
 
         sets: List[str] = []
         params: List[Any] = []
@@ -136,11 +173,14 @@ class SQLiteSubtaskRepository:
 
         changed = False
         if sets:
-            sets.append("updated_at_utc = datetime('now')")
+            sets.append("updated_at_utc = ?")
+            params.append(now)
             sql = f"UPDATE subtasks SET {', '.join(sets)} WHERE id = ?"
             params.append(subtask_id)
             cur.execute(sql, params)
-            changed = cur.rowcount > 0
+            if cur.rowcount == 0:
+                return False  # no such subtask
+            changed = True
 
         if note:
             # subtask_updates log
@@ -149,27 +189,29 @@ class SQLiteSubtaskRepository:
                 INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                             old_phase_id, new_phase_id,
                                             old_priority_id, new_priority_id)
-                SELECT ?, datetime('now'), ?, 'update',
+                SELECT ?, ?, ?, 'update',
                        phase_id, phase_id, priority_id, priority_id
                 FROM subtasks WHERE id = ?
                 """,
-                (subtask_id, note, subtask_id),
+                (subtask_id, now, note, subtask_id),
             )
-            # mirror to parent task
+            if cur.rowcount == 0:
+                return False  # no such subtask
+            # mirror to parent task (task_id read by the INSERT itself)
             cur.execute(
                 """
                 INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                          old_phase_id, new_phase_id,
                                          old_priority_id, new_priority_id)
-                SELECT ?, datetime('now'), ?, 'subtask_update',
+                SELECT s.task_id, ?, ?, 'subtask_update',
                        s.phase_id, s.phase_id, s.priority_id, s.priority_id
                 FROM subtasks s WHERE s.id = ?
                 """,
-                (task_id, f"[subtask #{subtask_id}] {note}", subtask_id),
+                (now, f"[subtask #{subtask_id}] {note}", subtask_id),
             )
             changed = True
 
-        if changed:
+        if changed and conn is None:
             con.commit()
         return changed
 
@@ -180,9 +222,11 @@ class SQLiteSubtaskRepository:
         *,
         reason: Optional[str] = None,
         note: Optional[str] = None,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> bool:
-        con = self._conn()
+        con = conn or self._conn()
         cur = con.cursor()
+        now = _utc_now()
 
         cur.execute("SELECT task_id, phase_id, priority_id FROM subtasks WHERE id = ?", (subtask_id,))
         r = cur.fetchone()
@@ -199,9 +243,9 @@ class SQLiteSubtaskRepository:
                     INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                                 old_phase_id, new_phase_id,
                                                 old_priority_id, new_priority_id)
-                    VALUES (?, datetime('now'), ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (subtask_id, note, reason or "update",
+                    (subtask_id, now, note, reason or "update",
                      old_phase_id, new_phase_id,
                      priority_id, priority_id),
                 )
@@ -210,13 +254,14 @@ class SQLiteSubtaskRepository:
                     INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                              old_phase_id, new_phase_id,
                                              old_priority_id, new_priority_id)
-                    VALUES (?, datetime('now'), ?, 'subtask_update',
+                    VALUES (?, ?, ?, 'subtask_update',
                             ?, ?, ?, ?)
                     """,
-                    (task_id, f"[subtask #{subtask_id}] {note or (reason or 'no-op')}",
+                    (task_id, now, f"[subtask #{subtask_id}] {note or (reason or 'no-op')}",
                      old_phase_id, new_phase_id, priority_id, priority_id),
                 )
-                con.commit()
+                if conn is None:
+                    con.commit()
             return True
 
         # perform phase change
@@ -228,9 +273,9 @@ class SQLiteSubtaskRepository:
             INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                         old_phase_id, new_phase_id,
                                         old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (subtask_id, note, reason or "phase_change",
+            (subtask_id, now, note, reason or "phase_change",
              old_phase_id, new_phase_id,
              priority_id, priority_id),
         )
@@ -241,20 +286,22 @@ class SQLiteSubtaskRepository:
             INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                      old_phase_id, new_phase_id,
                                      old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, 'subtask_phase_change',
+            VALUES (?, ?, ?, 'subtask_phase_change',
                     ?, ?, ?, ?)
             """,
-            (task_id, f"[subtask #{subtask_id}] {note or ''}".strip(),
+            (task_id, now, f"[subtask #{subtask_id}] {note or ''}".strip(),
              old_phase_id, new_phase_id,
              priority_id, priority_id),
         )
 
-        con.commit()
+        if conn is None:
+            con.commit()
         return cur.rowcount > 0
 
     def delete_subtask(self, subtask_id: int) -> bool:
         con = self._conn()
         cur = con.cursor()
+        now = _utc_now()
         cur.execute("SELECT task_id, priority_id FROM subtasks WHERE id = ?", (subtask_id,))
         r = cur.fetchone()
         task_id = (r["task_id"] if isinstance(r, sqlite3.Row) else r[0]) if r else None
@@ -269,10 +316,10 @@ class SQLiteSubtaskRepository:
                 INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                          old_phase_id, new_phase_id,
                                          old_priority_id, new_priority_id)
-                VALUES (?, datetime('now'), ?, 'subtask_delete',
+                VALUES (?, ?, ?, 'subtask_delete',
                         1, 1, ?, ?)
                 """,
-                (task_id, f"[subtask #{subtask_id}] deleted", priority_id, priority_id),
+                (task_id, now, f"[subtask #{subtask_id}] deleted", priority_id, priority_id),
             )
         if ok:
             con.commit()
@@ -320,7 +367,7 @@ class SQLiteSubtaskRepository:
         search: Optional[str] = None,
         limit: int = 500,
         offset: int = 0,
-        order_by: str = "s.updated_at_utc DESC",
+        order_by: str = "s.updated_at_utc DESC, s.id DESC",
     ) -> List[Dict[str, Any]]:
         con = self._conn()
         cur = con.cursor()
@@ -346,6 +393,93 @@ class SQLiteSubtaskRepository:
             (*params, limit, offset),
         )
         return [self._row_to_dict(r) for r in cur.fetchall()]
+
+    def list_tasks_for_project(self, project_id: int) -> List[Tuple[int, str]]:
+        """(id, name) of every task in the project, subtasks or not, ordered by id."""
+        cur = self._conn().execute(
+            "SELECT id, name FROM tasks WHERE project_id = ? ORDER BY id",
+            (project_id,),
+        )
+        return [(r[0], r[1]) for r in cur.fetchall()]
+
+    def list_subtask_names_for_project(self, project_id: int) -> List[Tuple[int, int, str]]:
+        """(task_id, id, name) of every subtask in the project, ordered by task_id, id."""
+        cur = self._conn().execute(
+            "SELECT s.task_id, s.id, s.name FROM subtasks s JOIN tasks t ON t.id = s.task_id "
+            "WHERE t.project_id = ? ORDER BY s.task_id, s.id",
+            (project_id,),
+        )
+        return [(r[0], r[1], r[2]) for r in cur.fetchall()]
+
+    # Tasks (id order, with their subtask count) then the newest subtasks, told apart
+    # by the leading kind column. ord is the task id for task rows and constant for
+    # subtask rows, so the one compound ORDER BY gives both orders.
+    _TASKS_AND_SUBTASKS_SQL = (
+        "SELECT 0 AS kind, t.id AS ord, NULL AS id, t.id AS task_id, NULL AS name, NULL AS description, "
+        "NULL AS phase_id, NULL AS priority_id, NULL AS created_at_utc, NULL AS updated_at_utc, "
+        "t.name AS task_name, COUNT(s.id) AS n "
+        "FROM tasks t LEFT JOIN subtasks s ON s.task_id = t.id WHERE t.project_id = ? GROUP BY t.id "
+        "UNION ALL "
+        "SELECT * FROM ("
+        "SELECT 1, 0, s.id, s.task_id, s.name, s.description, s.phase_id, s.priority_id, "
+        "s.created_at_utc, s.updated_at_utc, t.name, NULL "
+        "FROM subtasks s JOIN tasks t ON t.id = s.task_id WHERE t.project_id = ? "
+        "ORDER BY s.updated_at_utc DESC, s.id DESC LIMIT ?) "
+        "ORDER BY kind, ord, updated_at_utc DESC, id DESC"
+    )
+
+    # Subtask half of the statement above without the LIMIT: picks up at an offset
+    # in the same (updated DESC, id DESC) order
+    _SUBTASKS_FROM_SQL = (
+        "SELECT s.id, s.task_id, s.name, s.description, s.phase_id, s.priority_id, "
+        "s.created_at_utc, s.updated_at_utc, t.name "
+        "FROM subtasks s JOIN tasks t ON t.id = s.task_id WHERE t.project_id = ? "
+        "ORDER BY s.updated_at_utc DESC, s.id DESC LIMIT -1 OFFSET ?"
+    )
+
+    def list_tasks_and_subtasks_for_project(
+        self, project_id: int, *, limit: int = 500
+    ) -> Tuple[List[Tuple[int, str]], List[Dict[str, Any]], Dict[int, int]]:
+        """
+        One round-trip for a project's subtask view:
+        (list_tasks_for_project(), list_subtasks_for_project() rows each with a task_name,
+        {task_id: subtask count} over all of each task's subtasks, not just the listed ones).
+        """
+        tasks: List[Tuple[int, str]] = []
+        subtasks: List[Dict[str, Any]] = []
+        counts: Dict[int, int] = {}
+        cur = self._conn().execute(self._TASKS_AND_SUBTASKS_SQL, (project_id, project_id, limit))
+        for r in cur.fetchall():
+            if r[0] == 0:
+                tasks.append((r[3], r[10]))
+                counts[r[3]] = r[11]
+            else:
+                rec = self._row_to_dict(tuple(r[2:10]))
+                rec["task_name"] = r[10]
+                subtasks.append(rec)
+        return tasks, subtasks, counts
+
+    def iter_subtasks_for_project(
+        self, project_id: int, *, offset: int = 0, batch_size: int = 500
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the project's subtasks (each with a task_name) in fetchmany() batches,
+        newest first, starting `offset` rows in. No overall limit.
+        """
+        cur = self._conn().execute(self._SUBTASKS_FROM_SQL, (project_id, offset))
+        try:
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    return
+                out: List[Dict[str, Any]] = []
+                for r in batch:
+                    rec = self._row_to_dict(tuple(r[:8]))
+                    rec["task_name"] = r[8]
+                    out.append(rec)
+                yield out
+        finally:
+            cur.close()
     
     def set_subtask_priority(
         self,
@@ -354,9 +488,11 @@ class SQLiteSubtaskRepository:
         *,
         reason: str = "priority_change",
         note: str | None = None,
+        conn: Optional[sqlite3.Connection] = None,
     ) -> bool:
-        con = self._conn()
+        con = conn or self._conn()
         cur = con.cursor()
+        now = _utc_now()
 
         cur.execute("SELECT task_id, phase_id, priority_id FROM subtasks WHERE id = ?", (subtask_id,))
         row = cur.fetchone()
@@ -374,9 +510,9 @@ class SQLiteSubtaskRepository:
                     INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                                 old_phase_id, new_phase_id,
                                                 old_priority_id, new_priority_id)
-                    VALUES (?, datetime('now'), ?, ?, ?, ?, ?, ?)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
                     """,
-                    (subtask_id, note, reason, phase_id, phase_id, old_priority_id, new_priority_id),
+                    (subtask_id, now, note, reason, phase_id, phase_id, old_priority_id, new_priority_id),
                 )
                 # mirror to parent task timeline
                 cur.execute(
@@ -384,12 +520,13 @@ class SQLiteSubtaskRepository:
                     INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                              old_phase_id, new_phase_id,
                                              old_priority_id, new_priority_id)
-                    VALUES (?, datetime('now'), ?, 'subtask_update', ?, ?, ?, ?)
+                    VALUES (?, ?, ?, 'subtask_update', ?, ?, ?, ?)
                     """,
-                    (task_id, f"[subtask #{subtask_id}] {note or reason}",
+                    (task_id, now, f"[subtask #{subtask_id}] {note or reason}",
                      phase_id, phase_id, old_priority_id, new_priority_id),
                 )
-                con.commit()
+                if conn is None:
+                    con.commit()
             return True
 
         # perform change
@@ -401,9 +538,9 @@ class SQLiteSubtaskRepository:
             INSERT INTO subtask_updates(subtask_id, updated_at_utc, note, reason,
                                         old_phase_id, new_phase_id,
                                         old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (subtask_id, note, reason, phase_id, phase_id, old_priority_id, new_priority_id),
+            (subtask_id, now, note, reason, phase_id, phase_id, old_priority_id, new_priority_id),
         )
 
         # mirror note to parent task
@@ -412,15 +549,57 @@ class SQLiteSubtaskRepository:
             INSERT INTO task_updates(task_id, updated_at_utc, note, reason,
                                      old_phase_id, new_phase_id,
                                      old_priority_id, new_priority_id)
-            VALUES (?, datetime('now'), ?, 'subtask_priority_change', ?, ?, ?, ?)
+            VALUES (?, ?, ?, 'subtask_priority_change', ?, ?, ?, ?)
             """,
-            (task_id, f"[subtask #{subtask_id}] {note or (reason or 'priority_change')}",
+            (task_id, now, f"[subtask #{subtask_id}] {note or (reason or 'priority_change')}",
              phase_id, phase_id, old_priority_id, new_priority_id),
         )
 
-        con.commit()
+        if conn is None:
+            con.commit()
         return True
 
+    def apply_subtask_changes(
+        self,
+        subtask_id: int,
+        *,
+        phase_id: Optional[int] = None,
+        priority_id: Optional[int] = None,
+        note: Optional[str] = None,
+    ) -> bool:
+        """
+        Edit-dialog save: phase change, priority change, or a note-only entry,
+        in one transaction (one commit; readers never see half an edit).
+        The transaction is on this repo's connection: call it on the thread that owns it.
+        Returns False if the subtask does not exist or nothing was written.
+        """
+        con = self._conn()
+        cur = con.cursor()
+        started = not con.in_transaction
+        if started:
+            cur.execute("BEGIN IMMEDIATE")   # write lock first: the old values read below stay current
+        try:
+            changed = False
+            cur.execute("SELECT phase_id, priority_id FROM subtasks WHERE id = ?", (subtask_id,))
+            r = cur.fetchone()
+            if r:
+                old_phase_id, old_priority_id = r[0], r[1]
+                if phase_id is not None and int(phase_id) != int(old_phase_id):
+                    changed = self.change_subtask_phase(subtask_id, int(phase_id), reason="phase_change",
+                                                        note=note or None, conn=con)
+                if priority_id is not None and int(priority_id) != int(old_priority_id):
+                    changed = self.set_subtask_priority(subtask_id, int(priority_id), note=note or None,
+                                                        conn=con) or changed
+                if note and not changed:
+                    changed = self.update_subtask_fields(subtask_id, note=note, conn=con)
+        except Exception:
+            if started:
+                con.rollback()
+            raise
+        if started:
+            con.commit()
+        return changed
+
 
     def count_subtasks_total(self, *, task_id: int, phase_id: Optional[int] = None, search: Optional[str] = None) -> int:
         con = self._conn()
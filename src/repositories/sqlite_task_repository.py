@@ -250,7 +250,15 @@ class SQLiteTaskRepository:
             (*params, limit, offset),
         )
         return [self._row_to_task_dict(r) for r in cur.fetchall()]
-        
+
+    def list_tasks_for_project(self, project_id: int) -> List[Tuple[int, str]]:
+        """(id, name) of every task in the project, ordered by id (no paging)."""
+        cur = self._conn().execute(
+            "SELECT id, name FROM tasks WHERE project_id = ? ORDER BY id",
+            (project_id,),
+        )
+        return [(r[0], r[1]) for r in cur.fetchall()]
+
     def set_task_priority(
         self,
         task_id: int,
@@ -8,7 +8,7 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMainWindow, QToolBar, QDockWidget
 
-from ui.window_mode import lock_maximized
+from ui.window_mode import lock_to_screen
 from ui.workspace import WorkspaceStack
 from ui.panels.projects_panel import ProjectsPanel
 from ui.panels.project_overview_panel import ProjectOverviewPanel
@@ -23,6 +23,12 @@ except Exception:
 
 
 class MainWindow(QMainWindow):
+    # Navigation toolbar: (title, slot name, initially enabled), built in _build_nav_toolbar
+    NAV_ACTIONS = (
+        ("Back", "_nav_back", False),
+        ("Projects", "_nav_projects", True),
+    )
+
     def __init__(
         self,
         *,
@@ -37,6 +43,8 @@ class MainWindow(QMainWindow):
         **_ignored,
     ) -> None:
         super().__init__(parent)
+        # Suppress paints while panels/docks are built; re-enabled right before maximizing
+        self.setUpdatesEnabled(False)
 
         # --- Context ---
         self._projects_repo = projects_repo
@@ -46,6 +54,9 @@ class MainWindow(QMainWindow):
         self._attachments_repo = attachments_repo
         self._expenses_repo = expenses_repo
         self._logfile = logfile
+        self._repo_conn = self._resolve_conn_once(self._projects_repo)
+        self._projects_dirty: bool = True  # ProjectsPanel reloads only after a project mutation
+        self._edited_projects: set[int] = set()  # edited since last opened; next open re-queries them
 
         self.setWindowTitle("trackerZ — Workspace")
 
@@ -69,21 +80,11 @@ class MainWindow(QMainWindow):
         self._ws.add_panel("overview", self._p_overview)
 
         # --- History (Back) ---
-        from collections import deque
         self._history: deque[str] = deque(maxlen=20)
+        self._in_back = False  # True while _nav_back routes, so Back never re-pushes history
 
         # --- Toolbar ---
-        tb = QToolBar("Navigation", self)
-        self.addToolBar(Qt.TopToolBarArea, tb)
-
-        self._act_back = QAction("Back", self)
-        self._act_back.setEnabled(False)
-        self._act_back.triggered.connect(self._nav_back)
-        tb.addAction(self._act_back)
-
-        act_projects = QAction("Projects", self)
-        act_projects.triggered.connect(self._nav_projects)
-        tb.addAction(act_projects)
+        self._build_nav_toolbar()
 
         # --- Left Dock: Project Tree (collapsible) ---
         # inside __init__ (replace the existing tree panel creation):
@@ -104,43 +105,79 @@ class MainWindow(QMainWindow):
 
         # --- Diagnostics dock (optional) ---
         if _HAS_DIAG:
-            self._dock_diag = QDockWidget("Diagnostics", self)
+            # DiagnosticsPanel is already a QDockWidget; add it directly instead of nesting it
+            self._dock_diag = DiagnosticsPanel(self)
             self._dock_diag.setObjectName("DiagnosticsDock")
-            self._diag_widget = DiagnosticsPanel(self)
-            self._dock_diag.setWidget(self._diag_widget)
             self.addDockWidget(Qt.BottomDockWidgetArea, self._dock_diag)
 
         # --- Wiring panel signals ---
-        self._p_projects.projectSelected.connect(self._open_project_overview)
+        # UniqueConnection: re-wiring a rebuilt/re-added panel never doubles slot invocations
+        self._p_projects.projectSelected.connect(self._open_project_overview, Qt.UniqueConnection)
+        # Every project write in the app goes through the overview's editor
+        self._p_overview.projectEdited.connect(self._mark_projects_dirty, Qt.UniqueConnection)
+        self._p_overview.projectEdited.connect(self._mark_project_edited, Qt.UniqueConnection)
 
         # --- Initial ---
-        self._route_to("projects")
-        self._p_projects.load()
+        self._nav_projects()
 
         # --- Window policy ---
-        lock_maximized(self, lock_resize=True)
+        self.setUpdatesEnabled(True)
+        # Opens maximized on the caller's show() (main.py) instead of showing itself here;
+        # the size lock needs the screen it opens on (showEvent)
+        self._size_locked = False
+        self.setWindowState(self.windowState() | Qt.WindowMaximized)
+
+    def _build_nav_toolbar(self) -> None:
+        tb = QToolBar("Navigation", self)
+        self.addToolBar(Qt.TopToolBarArea, tb)
+        actions: dict[str, QAction] = {}
+        for title, slot_name, enabled in self.NAV_ACTIONS:
+            act = QAction(title, self)
+            act.setEnabled(enabled)
+            act.triggered.connect(getattr(self, slot_name))
+            tb.addAction(act)
+            actions[slot_name] = act
+        self._act_back = actions["_nav_back"]  # _route_to toggles it with history
 
     # ---------- routing ----------
 
     def _route_to(self, key: str) -> None:
         cur = self._ws.current_key()
-        if cur and cur != key:
+        if not self._in_back and cur and cur != key:
             self._history.append(cur)
         self._ws.show_panel(key)
+        # The tree belongs to the bound project: shown with its overview (also via Back), hidden on Projects
+        if key == "overview" and self._tree_panel.project_id() is not None:
+            self._dock_tree.show()
+        elif key == "projects":
+            self._dock_tree.hide()
         self._act_back.setEnabled(len(self._history) > 0)
 
     def _nav_back(self) -> None:
         if not self._history:
             return
         key = self._history.pop()
-        self._ws.show_panel(key)
-        self._act_back.setEnabled(len(self._history) > 0)
+        self._in_back = True
+        try:
+            self._route_to(key)
+        finally:
+            self._in_back = False
 
     def _nav_projects(self) -> None:
-        # When leaving a project, clear the static tree
-        self._tree_panel.clear_project()
+        # Leaving a project hides the tree (_route_to); it is re-shown (not rebuilt) on return
         self._route_to("projects")
-        self._p_projects.load()
+        if self._projects_dirty:
+            self._p_projects.load()
+            self._projects_dirty = False
+
+    def _mark_projects_dirty(self, *_project_id) -> None:
+        """Call after a project is created/edited so the next visit reloads the list."""
+        self._projects_dirty = True
+
+    def _mark_project_edited(self, project_id: int) -> None:
+        """The overview's tabs no longer match this project; its next open re-queries them and the tree."""
+        self._p_overview.invalidate()
+        self._edited_projects.add(project_id)
 
     # ---------- panel-driven navigation ----------
 
@@ -153,7 +190,7 @@ class MainWindow(QMainWindow):
         pname = f"Project {project_id}"
         try:
             # Try a light lookup (works with your repositories)
-            con = self._extract_conn(self._projects_repo)
+            con = self._repo_conn
             if con:
                 cur = con.cursor()
                 cur.execute("SELECT name FROM projects WHERE id = ?", (project_id,))
@@ -163,7 +200,12 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
+        # A new project is fetched by set_project(); the bound one only if it was edited since
+        same = self._tree_panel.project_id() == project_id
         self._tree_panel.set_project(project_id, pname)
+        if same and project_id in self._edited_projects:
+            self._tree_panel.refresh()
+        self._edited_projects.discard(project_id)
         self._route_to("overview")
         self._p_overview.load(project_id)
         if hasattr(self._p_overview, "select_tab"):
@@ -178,19 +220,24 @@ class MainWindow(QMainWindow):
         if hasattr(self._p_overview, "select_tab"):
             self._p_overview.select_tab(key)
 
+    # ---------- Qt overrides ----------
+
+    def showEvent(self, e):
+        if not self._size_locked:
+            self._size_locked = True
+            lock_to_screen(self)
+        super().showEvent(e)
+
     # ---------- utils ----------
 
-    def _extract_conn(self, repo):
-        if hasattr(repo, "conn"):
-            c = getattr(repo, "conn")
-            if c:
+    @staticmethod
+    def _resolve_conn_once(repo):
+        """Find the repo's sqlite3 connection (.conn, ._db.conn or ._db_or_conn.conn); None if absent."""
+        c = getattr(repo, "conn", None)
+        if c:
+            return c
+        for attr in ("_db", "_db_or_conn"):
+            c = getattr(getattr(repo, attr, None), "conn", None)
+            if c is not None:
                 return c
-        if hasattr(repo, "_db"):
-            inner = getattr(repo, "_db")
-            if hasattr(inner, "conn"):
-                return getattr(inner, "conn")
-        if hasattr(repo, "_db_or_conn"):
-            inner = getattr(repo, "_db_or_conn")
-            if hasattr(inner, "conn"):
-                return getattr(inner, "conn")
         return None
@@ -1,9 +1,172 @@
 # Rev 0.6.8 — Show ALL change lines (phase + priority if both), no phantom badges
 from __future__ import annotations
-from typing import List, Dict, Any
+from typing import List, Dict, Tuple, Sequence
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QScrollArea, QFrame, QSizePolicy
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QRect, QSize, QPointF
+from PySide6.QtGui import QPalette, QColor, QStaticText, QFont, QFontMetrics
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame, QSizePolicy,
+    QListView, QStyledItemDelegate, QAbstractItemView,
+)
+
+from models.entities import HistoryUpdate
+
+# Row tuple cached by the model: (timestamp, reason, badge_text, summary_lines, note)
+_HistoryRow = Tuple[str, str, str, Tuple[str, ...], str]
+_ROW_ROLE = Qt.UserRole + 1
+
+# Card geometry (mirrors the old QFrame/QVBoxLayout card margins and spacing)
+_OUTER_H, _OUTER_V = 12, 4      # gap between cards and the viewport edge
+_PAD_H, _PAD_V = 12, 8          # card padding
+_SPACING = 6                    # between lines inside a card
+_BADGE_PAD_H, _BADGE_PAD_V = 6, 2
+
+# Badge colours per reason (fg, bg), same palette as the task timeline; parsed once
+_BADGE_STYLES = {
+    reason: (QColor(fg), QColor(bg))
+    for reason, (fg, bg) in {
+        "create":          ("#00bb66", "#e6fff5"),
+        "update":          ("#0066cc", "#e6f2ff"),
+        "note":            ("#555555", "#f2f2f2"),
+        "phase_change":    ("#aa4400", "#fff2e6"),
+        "priority_change": ("#aa0066", "#ffe6f5"),
+    }.items()
+}
+_BADGE_DEFAULT = (QColor("#444444"), QColor("#eeeeee"))
+
+_PHASE_FMT = "Phase: %s → %s"
+_PRIORITY_FMT = "Priority: %s → %s"
+
+
+class _HistoryModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[_HistoryRow] = []
+
+    def set_rows(self, rows: List[_HistoryRow]) -> bool:
+        """Recycle existing rows: rewrite changed ones in place, insert/remove only the tail.
+        Returns True if any existing row changed (its height may differ)."""
+        n_old, n_new = len(self._rows), len(rows)
+        common = min(n_old, n_new)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._rows[n_new:]
+            self.endRemoveRows()
+        changed = [i for i in range(common) if self._rows[i] != rows[i]]
+        if changed:
+            self._rows[:common] = rows[:common]
+            self.dataChanged.emit(self.index(changed[0]), self.index(changed[-1]))
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows.extend(rows[n_old:])
+            self.endInsertRows()
+        return bool(changed)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == _ROW_ROLE:
+            return row
+        if role == Qt.DisplayRole:
+            return "\n".join(p for p in (row[0], row[2], *row[3], row[4]) if p)
+        return None
+
+
+class _HistoryDelegate(QStyledItemDelegate):
+    """Paints one history card per row; heights are cached per (row content, width)."""
+
+    def __init__(self, view: QListView, card_font: QFont, badge_font: QFont):
+        super().__init__(view)
+        self._view = view
+        self._card_font = card_font
+        self._badge_font = badge_font
+        self._card_fm = QFontMetrics(card_font)
+        self._heights: Dict[Tuple[_HistoryRow, int], int] = {}
+        self._badge_static: Dict[str, QStaticText] = {}   # badge text -> pre-shaped text
+
+    def _badge(self, text: str) -> QStaticText:
+        st = self._badge_static.get(text)
+        if st is None:
+            st = QStaticText(text)
+            st.setTextFormat(Qt.PlainText)
+            st.prepare(font=self._badge_font)
+            self._badge_static[text] = st
+        return st
+
+    def _text_width(self) -> int:
+        return max(40, self._view.viewport().width() - 2 * (_OUTER_H + _PAD_H))
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:
+        width = self._text_width()
+        row = index.data(_ROW_ROLE)
+        key = (row, width)
+        h = self._heights.get(key)
+        if h is None:
+            ts, reason, badge, lines, note = row
+            fm = self._card_fm
+            lh = fm.height()
+            h = _PAD_V + lh + 2 * _BADGE_PAD_V
+            h += len(lines) * (_SPACING + lh)
+            if note:
+                h += _SPACING + fm.boundingRect(QRect(0, 0, width, 100_000), Qt.TextWordWrap, note).height()
+            h += _PAD_V + 2 * _OUTER_V
+            if len(self._heights) > 4096:
+                self._heights.clear()
+            self._heights[key] = h
+        return QSize(self._text_width() + 2 * (_OUTER_H + _PAD_H), h)
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        ts, reason, badge, lines, note = index.data(_ROW_ROLE)
+        pal = option.palette
+        lh = self._card_fm.height()
+
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing, True)
+        painter.setFont(self._card_font)
+
+        card = option.rect.adjusted(_OUTER_H, _OUTER_V, -_OUTER_H, -_OUTER_V)
+        painter.setPen(pal.color(QPalette.Mid))
+        painter.setBrush(pal.base())
+        painter.drawRoundedRect(card, 6, 6)
+
+        inner = card.adjusted(_PAD_H, _PAD_V, -_PAD_H, -_PAD_V)
+        row1_h = lh + 2 * _BADGE_PAD_V
+
+        # row 1: badge (right) + timestamp (left, dim)
+        st = self._badge(badge)
+        st_size = st.size()
+        bw = int(st_size.width()) + 2 * _BADGE_PAD_H
+        badge_rect = QRect(inner.right() - bw + 1, inner.top(), bw, row1_h)
+        fg, bg = _BADGE_STYLES.get(reason, _BADGE_DEFAULT)
+        painter.setPen(fg)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(badge_rect, 6, 6)
+        painter.drawStaticText(
+            QPointF(badge_rect.left() + _BADGE_PAD_H, badge_rect.top() + (row1_h - st_size.height()) / 2),
+            st,
+        )
+
+        painter.setPen(pal.color(QPalette.PlaceholderText))
+        ts_rect = QRect(inner.left(), inner.top(), max(0, inner.width() - bw - 8), row1_h)
+        painter.drawText(ts_rect, Qt.AlignLeft | Qt.AlignVCenter, ts)
+
+        # summary lines + optional note
+        painter.setPen(pal.color(QPalette.Text))
+        y = inner.top() + row1_h
+        for line in lines:
+            y += _SPACING
+            painter.drawText(QRect(inner.left(), y, inner.width(), lh), Qt.AlignLeft | Qt.AlignVCenter, line)
+            y += lh
+        if note:
+            y += _SPACING
+            painter.drawText(QRect(inner.left(), y, inner.width(), inner.bottom() - y + 1),
+                             Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, note)
+
+        painter.restore()
 
 
 class HistoryPanel(QWidget):
@@ -17,42 +180,59 @@ class HistoryPanel(QWidget):
         header = QHBoxLayout()
         header.addWidget(self._title, 1)
 
-        self._list_layout = QVBoxLayout()
-        self._list_layout.setContentsMargins(12, 8, 12, 12)
-        self._list_layout.setSpacing(8)
+        self._model = _HistoryModel(self)
+        self._view = QListView()
+        self._view.setObjectName("HistoryPanelBody")
+        self._view.setModel(self._model)
 
-        body = QWidget()
-        body.setObjectName("HistoryPanelBody")
-        body.setLayout(self._list_layout)
+        # One font/metrics pair shared by every card (sizeHint and paint)
+        self._card_font = QFont(self._view.font())
+        self._badge_font = QFont(self._card_font)
+        self._badge_font.setBold(True)
+        self._delegate = _HistoryDelegate(self._view, self._card_font, self._badge_font)
+        self._view.setItemDelegate(self._delegate)
+        self._view.setSelectionMode(QAbstractItemView.NoSelection)
+        self._view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._view.setFocusPolicy(Qt.NoFocus)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self._view.setResizeMode(QListView.Adjust)
+        self._view.setWordWrap(True)
 
-        self._scroll = QScrollArea()
-        self._scroll.setWidgetResizable(True)
-        self._scroll.setWidget(body)
+        self._empty = self._empty_state()
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.addLayout(header)
-        root.addWidget(self._scroll, 1)
+        root.addWidget(self._empty)
+        root.addWidget(self._view, 1)
 
         self.set_updates([])
 
     # ---- Public API
-    def set_updates(self, updates: List[Dict[str, Any]]) -> None:
-        self._clear()
-        if not updates:
-            self._list_layout.addWidget(self._empty_state())
-            self._list_layout.addStretch(1)
-            return
-        for u in updates:
-            self._list_layout.addWidget(self._make_card(u))
-        self._list_layout.addStretch(1)
+    def set_updates(self, updates: Sequence[HistoryUpdate]) -> None:
+        rows: List[_HistoryRow] = []
+        for u in updates or []:
+            reason = u.reason.lower()
+            rows.append((
+                u.updated_local or u.updated_at_utc,
+                reason,
+                self._badge_text(reason),
+                tuple(self._summary_lines(u, reason)),
+                u.note.strip(),
+            ))
+        # remove/dataChanged/insert and the relayout collapse into one repaint
+        self.setUpdatesEnabled(False)
+        try:
+            if self._model.set_rows(rows):
+                # rows rewritten in place keep their old geometry until relaid out
+                self._view.doItemsLayout()
+            self._empty.setVisible(not rows)
+            self._view.setVisible(bool(rows))
+        finally:
+            self.setUpdatesEnabled(True)
 
     # ---- Internals
-    def _clear(self) -> None:
-        while (item := self._list_layout.takeAt(0)):
-            w = item.widget()
-            if w: w.deleteLater()
-
     def _empty_state(self) -> QWidget:
         box = QFrame()
         box.setFrameShape(QFrame.StyledPanel)
@@ -63,42 +243,6 @@ class HistoryPanel(QWidget):
         lay.addWidget(lbl)
         return box
 
-    def _make_card(self, u: Dict[str, Any]) -> QWidget:
-        ts = u.get("updated_local") or u.get("updated_at_utc") or ""
-        reason = (u.get("reason") or "update").lower()
-
-        card = QFrame()
-        card.setObjectName("HistoryCard")
-        card.setFrameShape(QFrame.StyledPanel)
-        card.setProperty("historyReason", reason)
-
-        outer = QVBoxLayout(card)
-        outer.setContentsMargins(12, 8, 12, 8)
-        outer.setSpacing(6)
-
-        # row 1: timestamp + badge
-        row1 = QHBoxLayout()
-        row1.setSpacing(8)
-        ts_lbl = QLabel(ts); ts_lbl.setObjectName("HistoryTimestamp"); ts_lbl.setProperty("dim", True)
-        badge = QLabel(self._badge_text(reason)); badge.setObjectName("HistoryBadge"); badge.setProperty("badgeKind", reason)
-        badge.setMargin(4); badge.setAlignment(Qt.AlignCenter); badge.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        badge.setStyleSheet("QLabel#HistoryBadge { border-radius: 6px; padding: 2px 6px; }")
-        row1.addWidget(ts_lbl, 1); row1.addWidget(badge, 0, Qt.AlignRight)
-        outer.addLayout(row1)
-
-        # summary lines (can be multiple)
-        for line in self._summary_lines(u):
-            s_lbl = QLabel(line); s_lbl.setObjectName("HistorySummary")
-            outer.addWidget(s_lbl)
-
-        # note (optional)
-        note = (u.get("note") or "").strip()
-        if note:
-            note_lbl = QLabel(note); note_lbl.setWordWrap(True); note_lbl.setObjectName("HistoryNote")
-            outer.addWidget(note_lbl)
-
-        return card
-
     @staticmethod
     def _badge_text(reason: str) -> str:
         mapping = {
@@ -111,21 +255,19 @@ class HistoryPanel(QWidget):
         return mapping.get(reason, reason)
 
     @staticmethod
-    def _summary_lines(u: Dict[str, Any]) -> List[str]:
+    def _summary_lines(u: HistoryUpdate, reason: str) -> List[str]:
         lines: List[str] = []
 
         # Only produce lines if both sides are present (ViewModel already nulls non-changes)
-        if u.get("old_phase_id") is not None and u.get("new_phase_id") is not None:
-            oldn = u.get("old_phase_name") or str(u.get("old_phase_id"))
-            newn = u.get("new_phase_name") or str(u.get("new_phase_id"))
-            lines.append(f"Phase: {oldn} → {newn}")
+        op, np_ = u.old_phase_id, u.new_phase_id
+        if op is not None and np_ is not None:
+            lines.append(_PHASE_FMT % (u.old_phase_name or op, u.new_phase_name or np_))
 
-        if u.get("old_priority_id") is not None and u.get("new_priority_id") is not None:
-            oldp = u.get("old_priority_name") or str(u.get("old_priority_id"))
-            newp = u.get("new_priority_name") or str(u.get("new_priority_id"))
-            lines.append(f"Priority: {oldp} → {newp}")
+        oq, nq = u.old_priority_id, u.new_priority_id
+        if oq is not None and nq is not None:
+            lines.append(_PRIORITY_FMT % (u.old_priority_name or oq, u.new_priority_name or nq))
 
-        if not lines and (u.get("reason") == "create"):
+        if not lines and reason == "create":
             lines.append("Created")
 
         return lines
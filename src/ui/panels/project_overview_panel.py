@@ -1,15 +1,11 @@
 # Rev 0.6.8 — M6.5 ProjectOverviewPanel (aligned to Rev 0.6.5 tabs)
 from __future__ import annotations
-from typing import Optional
+from typing import Optional, Callable, Dict, Set
+from PySide6.QtCore import QSignalBlocker, Signal
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
 
-# Reuse existing tabs from your codebase
-from ui.tabs.overview_tab import OverviewTab
-from ui.tabs.tasks_tab import TasksTab
-from ui.tabs.subtasks_tab import SubtasksTab
-from ui.tabs.attachments_tab import AttachmentsTab
-from ui.tabs.expenses_tab import ExpensesTab
-from ui.tabs.history_tab import HistoryTab
+from ui.tabs import tab_class
+
 
 class ProjectOverviewPanel(QWidget):
     """
@@ -17,6 +13,8 @@ class ProjectOverviewPanel(QWidget):
     inside a QWidget so the whole overview can live in the WorkspaceStack.
     """
 
+    projectEdited = Signal(int)   # project_id; re-emitted from the Overview tab's editor
+
     def __init__(
         self,
         *,
@@ -44,60 +42,77 @@ class ProjectOverviewPanel(QWidget):
         lay.addWidget(self._tabs)
 
         # Constructor signatures from your Rev 0.6.8 tabs:
-        OverviewTab(projects_repo, tasks_repo, subtasks_repo, phases_repo, parent=None)
-        TasksTab(tasks_repo, phases_repo, parent=None)
+        # - OverviewTab(projects_repo, tasks_repo, subtasks_repo, phases_repo, parent=None)
+        # - TasksTab(tasks_repo, phases_repo, parent=None)
         # - SubtasksTab(subtasks_repo, parent=None)
         # - AttachmentsTab(parent=None)
         # - ExpensesTab(parent=None)
         # - HistoryTab(parent=None)
+        # Tabs are built on first activation; a placeholder holds each slot until then.
+        self._tab_keys = ["overview", "tasks", "subtasks", "attachments", "expenses", "history"]
+        self._tab_factories: Dict[str, Callable[[], QWidget]] = {
+            "overview":    lambda: tab_class("ui.tabs.overview_tab", "OverviewTab")(
+                               self._projects_repo, self._tasks_repo, self._subtasks_repo, self._phases_repo, self),
+            "tasks":       lambda: tab_class("ui.tabs.tasks_tab", "TasksTab")(self._tasks_repo, self._phases_repo, self),
+            "subtasks":    lambda: tab_class("ui.tabs.subtasks_tab", "SubtasksTab")(self._subtasks_repo, self),
+            "attachments": lambda: tab_class("ui.tabs.attachments_tab", "AttachmentsTab")(self),
+            "expenses":    lambda: tab_class("ui.tabs.expenses_tab", "ExpensesTab")(self),
+            "history":     lambda: tab_class("ui.tabs.history_tab", "HistoryTab")(self),
+        }
+        labels = ("Overview", "Tasks", "Subtasks", "Attachments", "Expenses", "History")
+        for label in labels:
+            self._tabs.addTab(QWidget(), label)
 
-        self._tab_overview = OverviewTab(self._projects_repo, self._tasks_repo, self._subtasks_repo, self._phases_repo, self)
-        self._tab_tasks = TasksTab(self._tasks_repo, self._phases_repo, self)
-        self._tab_subtasks = SubtasksTab(self._subtasks_repo, self)
-        self._tab_attachments = AttachmentsTab(self)
-        self._tab_expenses = ExpensesTab(self)
-        self._tab_history = HistoryTab(self)
+        self._built: Set[int] = set()
+        self._loadables: Dict[int, Callable[[int], None]] = {}   # tab index -> bound load(), resolved at build
+        self._loaded_for: Dict[int, Optional[int]] = {}   # tab index -> project_id it last loaded
+        self._tabs.currentChanged.connect(self._ensure_tab)
 
-        self._tabs.addTab(self._tab_overview, "Overview")
-        self._tabs.addTab(self._tab_tasks, "Tasks")
-        self._tabs.addTab(self._tab_subtasks, "Subtasks")
-        self._tabs.addTab(self._tab_attachments, "Attachments")
-        self._tabs.addTab(self._tab_expenses, "Expenses")
-        self._tabs.addTab(self._tab_history, "History")
-        
     def select_tab(self, key: str) -> None:
         """Select a tab by semantic key."""
-        mapping = {
-            "overview":   self._tab_overview,
-            "tasks":      self._tab_tasks,
-            "subtasks":   self._tab_subtasks,
-            "attachments": self._tab_attachments,
-            "expenses":    self._tab_expenses,
-            "history":     self._tab_history,
-        }
-        widget = mapping.get(key)
-        if widget is None:
+        if key not in self._tab_keys:
             return
-        idx = self._tabs.indexOf(widget)
-        if idx >= 0:
-            self._tabs.setCurrentIndex(idx)
+        idx = self._tab_keys.index(key)
+        if self._tabs.currentIndex() != idx:
+            self._tabs.setCurrentIndex(idx)   # currentChanged -> _ensure_tab
+        else:
+            self._ensure_tab(idx)
 
     def load(self, project_id: int) -> None:
+        # Same project, nothing invalidated: tabs already hold its data; just show Overview
+        if project_id == self._project_id and self._loaded_for:
+            self.select_tab("overview")
+            return
+        # Only the visible tab loads now; others load when first shown for this project
         self._project_id = project_id
         self.select_tab("overview")
-        # Mirror your ProjectOverviewWindow.load() behavior
-        idx = self._tabs.indexOf(self._tab_overview)
-        if idx >= 0:
-            self._tabs.setCurrentIndex(idx)
-        if hasattr(self._tab_overview, "load"):
-            self._tab_overview.load(project_id)
-        if hasattr(self._tab_tasks, "load"):
-            self._tab_tasks.load(project_id)
-        if hasattr(self._tab_subtasks, "load"):
-            self._tab_subtasks.load(project_id)
-        if hasattr(self._tab_attachments, "load"):
-            self._tab_attachments.load(project_id)
-        if hasattr(self._tab_expenses, "load"):
-            self._tab_expenses.load(project_id)
-        if hasattr(self._tab_history, "load"):
-            self._tab_history.load(project_id)
+
+    def invalidate(self) -> None:
+        """Forget what each tab loaded so the next load()/activation re-queries."""
+        self._loaded_for.clear()
+
+    # ---- lazy tabs
+    def _ensure_tab(self, idx: int) -> None:
+        if idx < 0 or idx >= len(self._tab_keys):
+            return
+        if idx not in self._built:
+            real = self._tab_factories[self._tab_keys[idx]]()
+            placeholder = self._tabs.widget(idx)
+            label = self._tabs.tabText(idx)
+            with QSignalBlocker(self._tabs):
+                self._tabs.removeTab(idx)
+                self._tabs.insertTab(idx, real, label)
+                self._tabs.setCurrentIndex(idx)
+            placeholder.deleteLater()
+            self._built.add(idx)
+            if hasattr(real, "projectEdited"):
+                real.projectEdited.connect(self.projectEdited)
+            fn = getattr(real, "load", None)
+            if callable(fn):
+                self._loadables[idx] = fn
+
+        if self._project_id is not None and self._loaded_for.get(idx) != self._project_id:
+            fn = self._loadables.get(idx)
+            if fn is not None:
+                fn(self._project_id)
+            self._loaded_for[idx] = self._project_id
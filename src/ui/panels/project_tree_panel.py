@@ -1,10 +1,82 @@
 # Rev 0.6.8 — ProjectTreePanel (Tasks/Subtasks by name; subtasks fetched by task_id only)
 from __future__ import annotations
+import functools
+import inspect
+import logging
+import sqlite3
+from contextlib import closing
+from collections import defaultdict
 from typing import Optional, Iterable, Tuple, Dict, Any
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTreeWidget, QTreeWidgetItem, QLabel
 
+from repositories.db import connect, database_path
+
+log = logging.getLogger(__name__)
+
+_TASK_METHODS = ("list_tasks_for_project", "list_tasks", "list_project_tasks", "list_tasks_filtered")
+_SUBTASK_METHODS = ("list_for_task", "list_subtasks_for_task", "list_subtasks")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(repo_type: type, names: Tuple[str, ...]) -> Optional[str]:
+    """First of `names` defined on `repo_type`; probed once per repo class."""
+    return next((n for n in names if hasattr(repo_type, n)), None)
+
+
+@functools.lru_cache(maxsize=None)
+def _takes_kw(repo_type: type, method: str, kw: str) -> bool:
+    try:
+        return kw in inspect.signature(getattr(repo_type, method)).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+class _FetchSignals(QObject):
+    fetched = Signal(int, object, object, str)     # project_id, [(tid, name)], {tid: [(sid, name)]}, error ("" on success)
+
+
+def _rebind(repo, con):
+    """Same repository class over another connection (None stays None)."""
+    return type(repo)(con) if repo is not None else None
+
+
+class _ProjectFetchJob(QRunnable):
+    """
+    Reads the tree's rows; the result is delivered by a queued signal. On the pool it goes
+    through the panel's repositories rebuilt over a read-only connection of its own (db_path),
+    closed when the job ends; without a database file it is run on the GUI thread.
+    """
+
+    def __init__(self, panel: "ProjectTreePanel", project_id: int) -> None:
+        super().__init__()
+        self._tasks_repo = panel._tasks_repo
+        self._subtasks_repo = panel._subtasks_repo
+        self._shared_conn = panel._extract_conn(panel._tasks_repo or panel._projects_repo)
+        self.db_path = panel._db_path
+        self._project_id = project_id
+        self.signals = _FetchSignals()
+
+    def run(self) -> None:
+        tasks, subtasks_by_task, error = [], {}, ""
+        try:
+            if self.db_path:
+                with closing(connect(self.db_path, readonly=True)) as con:
+                    tasks, subtasks_by_task = self._fetch(
+                        _rebind(self._tasks_repo, con), _rebind(self._subtasks_repo, con), con)
+            else:
+                tasks, subtasks_by_task = self._fetch(self._tasks_repo, self._subtasks_repo, self._shared_conn)
+        except sqlite3.Error as e:
+            error = str(e)
+        self.signals.fetched.emit(self._project_id, tasks, subtasks_by_task, error)
+
+    def _fetch(self, tasks_repo, subtasks_repo, con):
+        tasks = ProjectTreePanel._fetch_tasks(tasks_repo, con, self._project_id)
+        subtasks_by_task = ProjectTreePanel._fetch_all_subtasks(
+            subtasks_repo, con, self._project_id, [tid for tid, _ in tasks])
+        return tasks, subtasks_by_task
+
 
 class ProjectTreePanel(QWidget):
     """
@@ -17,12 +89,19 @@ class ProjectTreePanel(QWidget):
     taskActivated = Signal(int)                 # task_id
     subtaskActivated = Signal(int, int)        # task_id, subtask_id
 
+    # Raw-SQL fallbacks for repos without a listing method: constant text so sqlite3's
+    # per-connection statement cache hits
+    _TASKS_SQL = "SELECT id, name FROM tasks WHERE project_id = ? ORDER BY id ASC"
+    _SUBTASKS_SQL = "SELECT id, name FROM subtasks WHERE task_id = ? ORDER BY id ASC"
+
     def __init__(self, parent: Optional[QWidget] = None, *,
                  projects_repo=None, tasks_repo=None, subtasks_repo=None) -> None:
         super().__init__(parent)
         self._projects_repo = projects_repo
         self._tasks_repo = tasks_repo
         self._subtasks_repo = subtasks_repo
+        # Fetch jobs open their own read-only connection on this file ("" = in-memory: GUI thread)
+        self._db_path = database_path(tasks_repo or projects_repo)
 
         self._project_id: Optional[int] = None
         self._project_name: str = ""
@@ -32,6 +111,12 @@ class ProjectTreePanel(QWidget):
 
         self._tree = QTreeWidget(self)
         self._tree.setHeaderHidden(True)
+        self._tree.setUniformRowHeights(True)   # single-line name rows; skip per-row height queries
+
+        self._fetch_timer = QTimer(self)
+        self._fetch_timer.setSingleShot(True)
+        self._fetch_timer.setInterval(50)
+        self._fetch_timer.timeout.connect(self._start_fetch)
         self._tree.itemActivated.connect(self._on_item_activated)
         self._tree.itemClicked.connect(self._on_item_activated)
 
@@ -44,12 +129,29 @@ class ProjectTreePanel(QWidget):
 
     def set_project(self, project_id: int, project_name: str) -> None:
         """Bind this sidebar to a single project and render its Tasks/Subtasks."""
+        name = project_name or f"Project {project_id}"
+        if project_id == self._project_id and name == self._project_name:
+            return  # already bound; refresh() forces a rebuild
+        if project_id != self._project_id:
+            self._tree.clear()   # another project's rows; refresh() keeps the current ones until the fetch lands
         self._project_id = project_id
-        self._project_name = project_name or f"Project {project_id}"
-        self._title.setText(self._project_name)
-        self._render()
+        self._project_name = name
+        self._title.setText(name)
+        self.refresh()
+
+    def project_id(self) -> Optional[int]:
+        """The bound project (None when cleared)."""
+        return self._project_id
+
+    def refresh(self) -> None:
+        """Re-fetch and rebuild the tree for the bound project."""
+        if self._project_id is None:
+            return
+        # Rapid re-binds within the window collapse into one fetch for the last project
+        self._fetch_timer.start()
 
     def clear_project(self) -> None:
+        self._fetch_timer.stop()
         self._project_id = None
         self._project_name = ""
         self._title.setText("Project")
@@ -57,28 +159,58 @@ class ProjectTreePanel(QWidget):
 
     # ------------------- internals -------------------
 
-    def _render(self) -> None:
+    def _start_fetch(self) -> None:
+        if self._project_id is None:
+            return
+        job = _ProjectFetchJob(self, self._project_id)
+        job.signals.fetched.connect(self._on_fetched)
+        if job.db_path:
+            QThreadPool.globalInstance().start(job)
+        else:
+            job.run()   # in-memory database: only the shared connection can see it
+
+    def _on_fetched(self, project_id: int, tasks: list, subtasks_by_task: dict, error: str) -> None:
+        if project_id != self._project_id:
+            return  # stale result: the sidebar was re-bound while the job ran
+        if error:
+            log.warning("Project %s tree fetch failed: %s", project_id, error)
+            return  # keep whatever the tree shows
+        self._render(tasks, subtasks_by_task)
+
+    def _render(self, tasks: list[tuple[int, str]], subtasks_by_task: dict[int, list[tuple[int, str]]]) -> None:
+        self._tree.setUpdatesEnabled(False)
+        self._tree.blockSignals(True)
+        try:
+            self._render_items(tasks, subtasks_by_task)
+        finally:
+            self._tree.blockSignals(False)
+            self._tree.setUpdatesEnabled(True)
+
+    def _render_items(self, tasks: list[tuple[int, str]], subtasks_by_task: dict[int, list[tuple[int, str]]]) -> None:
         self._tree.clear()
         if self._project_id is None:
             return
 
         root = QTreeWidgetItem([self._project_name])
         root.setFlags(root.flags() & ~Qt.ItemIsSelectable)  # label-only parent
-        self._tree.addTopLevelItem(root)
 
-        # Fetch tasks by id/name (ordered by id)
-        tasks = self._fetch_tasks(self._project_id)
-        for tid, tname in tasks:
+        # Build the whole subtree detached, then attach it to the tree once
+        task_items: list[QTreeWidgetItem] = []
+        for tid, tname in tasks:  # ordered by id
             t_item = QTreeWidgetItem([tname or f"Task {tid}"])
             t_item.setData(0, Qt.UserRole, {"kind": "task", "task_id": tid})
-            root.addChild(t_item)
 
-            # Fetch subtasks by task_id ONLY (ordered by id)
-            for sid, sname in self._fetch_subtasks(tid):
+            # Subtasks by task_id ONLY (ordered by id)
+            sub_items = []
+            for sid, sname in subtasks_by_task.get(tid, ()):
                 s_item = QTreeWidgetItem([sname or f"Subtask {sid}"])
                 s_item.setData(0, Qt.UserRole, {"kind": "subtask", "task_id": tid, "subtask_id": sid})
-                t_item.addChild(s_item)
+                sub_items.append(s_item)
+            t_item.addChildren(sub_items)
+            task_items.append(t_item)
+        root.addChildren(task_items)
 
+        self._tree.addTopLevelItem(root)
         self._tree.expandItem(root)
 
     def _on_item_activated(self, item: QTreeWidgetItem) -> None:
@@ -91,32 +223,22 @@ class ProjectTreePanel(QWidget):
             self.subtaskActivated.emit(int(data["task_id"]), int(data["subtask_id"]))
 
     # ------------------- data fetch (robust) -------------------
+    # Run by _ProjectFetchJob with the repos (and connection) it reads through.
 
-    def _fetch_tasks(self, project_id: int) -> list[tuple[int, str]]:
+    @staticmethod
+    def _fetch_tasks(repo, con, project_id: int) -> list[tuple[int, str]]:
         """
         Return [(task_id, name), ...], ordered by id asc.
-        Tries repo methods first; falls back to raw SQL via extracted connection.
+        Tries repo methods first, then raw SQL on `con`.
         """
-        repo = self._tasks_repo
         rows: Iterable | None = None
 
         if repo:
-            # Try likely method names across variants
-            for meth in ("list_tasks_for_project", "list_tasks", "list_project_tasks"):
-                if hasattr(repo, meth):
-                    try:
-                        rows = getattr(repo, meth)(project_id=project_id)  # prefer kw
-                    except TypeError:
-                        rows = getattr(repo, meth)(project_id)            # positional fallback
-                    break
-            if rows is None and hasattr(repo, "list_tasks_filtered"):
-                try:
-                    rows = repo.list_tasks_filtered(project_id=project_id, phase_id=None)
-                except TypeError:
-                    try:
-                        rows = repo.list_tasks_filtered(project_id=project_id)
-                    except Exception:
-                        rows = None
+            # Likely method names across variants; resolution is cached per repo class
+            meth = _resolve(type(repo), _TASK_METHODS)
+            if meth:
+                fn = getattr(repo, meth)
+                rows = fn(project_id=project_id) if _takes_kw(type(repo), meth, "project_id") else fn(project_id)
 
         if rows is not None:
             parsed = []
@@ -130,33 +252,37 @@ class ProjectTreePanel(QWidget):
             return parsed
 
         # Raw SQL fallback
-        con = self._extract_conn(repo or self._projects_repo)
         if con is None:
             return []
-        cur = con.cursor()
-        cur.execute("SELECT id, name FROM tasks WHERE project_id = ? ORDER BY id ASC", (project_id,))
-        return [(int(r[0]), r[1] or "") for r in cur.fetchall()]
+        return [(tid, name or "") for tid, name in con.execute(ProjectTreePanel._TASKS_SQL, (project_id,))]
+
+    @staticmethod
+    def _fetch_all_subtasks(repo, con, project_id: int, task_ids: list[int]) -> dict[int, list[tuple[int, str]]]:
+        """
+        Return {task_id: [(subtask_id, name), ...]} for the whole project, ordered by task_id, id:
+        one repo query when the repo lists a project's subtask names, else per-task fetches.
+        """
+        if repo is None or not hasattr(repo, "list_subtask_names_for_project"):
+            return {tid: ProjectTreePanel._fetch_subtasks(repo, con, tid) for tid in task_ids}
+        grouped: dict[int, list[tuple[int, str]]] = defaultdict(list)
+        for tid, sid, name in repo.list_subtask_names_for_project(project_id):
+            grouped[tid].append((sid, name or ""))
+        return grouped
 
-    def _fetch_subtasks(self, task_id: int) -> list[tuple[int, str]]:
+    @staticmethod
+    def _fetch_subtasks(repo, con, task_id: int) -> list[tuple[int, str]]:
         """
         Return [(subtask_id, name), ...], ordered by id asc.
         NOTE: Fetch by task_id ONLY.
         """
-        repo = self._subtasks_repo
         rows: Iterable | None = None
 
         if repo:
             # Prefer explicit task-based APIs if present
-            for meth in ("list_for_task", "list_subtasks_for_task", "list_subtasks"):
-                if hasattr(repo, meth):
-                    try:
-                        rows = getattr(repo, meth)(task_id=task_id)
-                    except TypeError:
-                        try:
-                            rows = getattr(repo, meth)(task_id)
-                        except Exception:
-                            pass
-                    break
+            meth = _resolve(type(repo), _SUBTASK_METHODS)
+            if meth:
+                fn = getattr(repo, meth)
+                rows = fn(task_id=task_id) if _takes_kw(type(repo), meth, "task_id") else fn(task_id)
 
         if rows is not None:
             parsed = []
@@ -170,12 +296,9 @@ class ProjectTreePanel(QWidget):
             return parsed
 
         # Raw SQL fallback (task-only)
-        con = self._extract_conn(repo or self._projects_repo)
         if con is None:
             return []
-        cur = con.cursor()
-        cur.execute("SELECT id, name FROM subtasks WHERE task_id = ? ORDER BY id ASC", (task_id,))
-        return [(int(r[0]), r[1] or "") for r in cur.fetchall()]
+        return [(sid, name or "") for sid, name in con.execute(ProjectTreePanel._SUBTASKS_SQL, (task_id,))]
 
     # ---------- connection fishing ----------
 
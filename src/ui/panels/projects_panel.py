@@ -2,18 +2,37 @@
 # Rev 0.6.8 — emit selection on click/activate/double-click
 
 from __future__ import annotations
+import functools
 from typing import Optional, Iterable, Tuple, Dict, Any
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget, QListWidgetItem
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QListWidget
+
+_LIST_METHODS = ("list_projects_basic", "list_projects_overview", "list_all")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve(repo_type: type, names: Tuple[str, ...]) -> Optional[str]:
+    """First of `names` defined on `repo_type`; probed once per repo class."""
+    return next((n for n in names if hasattr(repo_type, n)), None)
+
 
 class ProjectsPanel(QWidget):
     projectSelected = Signal(int)  # project_id
+    _CHUNK = 50                    # rows added per event-loop turn
+    _PAGE = 200                    # rows per SQL page (raw-SQL path only)
+    _PAGE_SQL_BY_UPDATED = "SELECT id, name FROM projects ORDER BY updated_at_utc DESC, id DESC LIMIT ? OFFSET ?"
+    _PAGE_SQL_BY_ID = "SELECT id, name FROM projects ORDER BY id DESC LIMIT ? OFFSET ?"
 
     def __init__(self, *, projects_repo, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self._projects_repo = projects_repo
         self._title = QLabel("Projects")
         self._list = QListWidget(self)
+        self._pending_rows: list[Tuple[int, str]] = []
+        self._drain_scheduled = False
+        self._page_con = None           # set while more SQL pages remain
+        self._page_sql: Optional[str] = None   # chosen from the schema on the first load
+        self._page_offset = 0
 
         lay = QVBoxLayout(self)
         lay.addWidget(self._title)
@@ -23,47 +42,106 @@ class ProjectsPanel(QWidget):
         self._list.itemActivated.connect(self._emit_selection)     # Enter/double-click
         self._list.itemDoubleClicked.connect(self._emit_selection) # Double-click
         #self._list.itemClicked.connect(self._emit_selection)       # Single-click
+        self._list.verticalScrollBar().valueChanged.connect(self._maybe_fetch_page)
 
     def load(self) -> None:
+        self._page_con, self._page_offset = None, 0   # before clear(): it scrolls to 0
+        self._pending_rows = []
         self._list.clear()
         rows: Iterable[Tuple[int, str]] | Iterable[Dict[str, Any]] = []
         repo = self._projects_repo
 
         if repo:
-            if hasattr(repo, "list_projects_basic"):
-                rows = repo.list_projects_basic()
-            elif hasattr(repo, "list_projects_overview"):
-                rows = repo.list_projects_overview()
-            elif hasattr(repo, "list_all"):
-                rows = repo.list_all()
+            meth = _resolve(type(repo), _LIST_METHODS)
+            if meth:
+                rows = getattr(repo, meth)()
             else:
                 con = self._extract_conn(repo)
                 if con is not None:
-                    cur = con.cursor()
-                    try:
-                        cur.execute("SELECT id, name FROM projects ORDER BY updated_at_utc DESC, id DESC")
-                    except Exception:
-                        cur.execute("SELECT id, name FROM projects ORDER BY id DESC")
-                    rows = cur.fetchall()
-
-        count = 0
+                    if self._page_sql is None:
+                        self._page_sql = self._choose_page_sql(con)
+                    self._page_con = con
+                    rows = self._fetch_page()
+
+        parsed = self._parse(rows)
+        if not parsed:
+            parsed = [(pid, f"Placeholder Project {pid}") for pid in (1, 2, 3)]
+
+        # First chunk paints now; the rest streams in over later event-loop turns
+        self._pending_rows = parsed
+        self._add_batch()
+
+    @classmethod
+    def _choose_page_sql(cls, con) -> str:
+        """Newest-first by updated_at_utc when the projects table has it, else by id."""
+        try:
+            cols = {r[1] for r in con.execute("PRAGMA table_info(projects)")}
+        except Exception:
+            cols = set()
+        return cls._PAGE_SQL_BY_UPDATED if "updated_at_utc" in cols else cls._PAGE_SQL_BY_ID
+
+    def _fetch_page(self) -> list:
+        """Next _PAGE rows of the raw-SQL listing; stops paging after a short page."""
+        if self._page_con is None:
+            return []
+        rows = self._page_con.execute(self._page_sql, (self._PAGE, self._page_offset)).fetchall()
+        self._page_offset += len(rows)
+        if len(rows) < self._PAGE:
+            self._page_con = None
+        return rows
+
+    def _maybe_fetch_page(self, value: int) -> None:
+        if self._page_con is None or self._pending_rows:
+            return
+        sb = self._list.verticalScrollBar()
+        if value < sb.maximum() - 2 * sb.pageStep():
+            return
+        self._pending_rows = self._parse(self._fetch_page())
+        self._add_batch()
+
+    @staticmethod
+    def _parse(rows) -> list[Tuple[int, str]]:
+        parsed: list[Tuple[int, str]] = []
         for r in rows or []:
             if isinstance(r, dict):
                 pid = int(r.get("id"))
-                name = r.get("name", "")
+                parsed.append((pid, r.get("name", "")))
             else:
                 pid = int(r[0])
-                name = r[1] if len(r) > 1 else f"Project {pid}"
-            item = QListWidgetItem(f"{pid}: {name}")
-            item.setData(Qt.UserRole, pid)
-            self._list.addItem(item)
-            count += 1
-
-        if count == 0:
-            for pid in (1, 2, 3):
-                item = QListWidgetItem(f"{pid}: Placeholder Project {pid}")
-                item.setData(Qt.UserRole, pid)
-                self._list.addItem(item)
+                parsed.append((pid, r[1] if len(r) > 1 else f"Project {pid}"))
+        return parsed
+
+    def _drain_pending(self) -> None:
+        self._drain_scheduled = False
+        self._add_batch()
+
+    def _add_batch(self) -> None:
+        batch = self._pending_rows[:self._CHUNK]
+        self._pending_rows = self._pending_rows[self._CHUNK:]
+        self._list.setUpdatesEnabled(False)
+        try:
+            start = self._list.count()
+            # One rowsInserted for the whole chunk
+            self._list.addItems([f"{pid}: {name}" for pid, name in batch])
+            # UserRole is not displayed: skip the per-item dataChanged while tagging ids
+            with QSignalBlocker(self._list.model()):
+                for i, (pid, _) in enumerate(batch, start):
+                    self._list.item(i).setData(Qt.UserRole, pid)
+        finally:
+            self._list.setUpdatesEnabled(True)
+        if self._pending_rows:
+            if not self._drain_scheduled:
+                self._drain_scheduled = True
+                QTimer.singleShot(0, self._drain_pending)
+        elif self._page_con is not None:
+            self._fill_viewport()
+
+    def _fill_viewport(self) -> None:
+        # Without a scrollbar valueChanged never fires: keep paging until one appears (or rows run out)
+        self._list.doItemsLayout()
+        if self._list.verticalScrollBar().maximum() == 0:
+            self._pending_rows = self._parse(self._fetch_page())
+            self._add_batch()
 
     def _emit_selection(self, item=None) -> None:
         if item is None:
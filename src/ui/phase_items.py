@@ -0,0 +1,31 @@
+# Rev 0.7.0
+
+# ui/phase_items.py
+import functools
+from contextlib import closing
+from typing import Tuple
+
+from repositories.db import connect
+
+
+def _query(phases_repo) -> Tuple[Tuple[str, int], ...]:
+    return tuple((p["name"], int(p["id"])) for p in phases_repo.list_phases())
+
+
+@functools.lru_cache(maxsize=1)
+def _snapshot(phases_cls, db_path: str) -> Tuple[Tuple[str, int], ...]:
+    with closing(connect(db_path, readonly=True)) as con:
+        return _query(phases_cls(con))
+
+
+def phase_items(phases_repo, db_path: str = "") -> Tuple[Tuple[str, int], ...]:
+    """
+    (name, id) pairs from phases_repo.list_phases(), queried once per database file and shared
+    by every caller (keyed on the repo class and file, not on a repo instance).
+    Safe off the GUI thread: the query runs on a read-only connection of its own.
+    Without a file (in-memory) the repo is queried directly on each call.
+    Phases are seeded by migrations; call _snapshot.cache_clear() if they are ever edited.
+    """
+    if not db_path:
+        return _query(phases_repo)
+    return _snapshot(type(phases_repo), db_path)
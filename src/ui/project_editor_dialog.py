@@ -1,25 +1,136 @@
 # src/ui/project_editor_dialog.py
 # Rev 0.6.8 — Match Task/Subtask editor layout; read-only Name/Description; same behavior
 from __future__ import annotations
-from typing import Optional, Dict
+from contextlib import closing
+from typing import Optional, Dict, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QComboBox, QTextEdit,
     QDialogButtonBox, QLabel, QMessageBox, QLineEdit, QWidget
 )
+from repositories.db import connect, database_path
+from ui.phase_items import phase_items
 from ui.window_mode import lock_dialog_fixed
 
 _PHASE_NAMES = {1: "Open", 2: "In Progress", 3: "In Hiatus", 4: "Resolved", 5: "Closed"}
 _PRIORITY_NAMES = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
 
 
+class _FetchSignals(QObject):
+    fetched = Signal(object, object)        # phase items, project record (or None)
+
+
+class _EditorFetchJob(QRunnable):
+    """
+    Loads the dialog's phase list and project record. On the pool it reads through a
+    read-only connection of its own (db_path); without a database file it is run on the GUI thread.
+    """
+
+    def __init__(self, dlg: "ProjectEditorDialog") -> None:
+        super().__init__()
+        self._phases = dlg._phases
+        self._projects = dlg._projects
+        self._project_id = dlg._project_id
+        self.db_path = dlg._db_path
+        self.signals = _FetchSignals()
+
+    def run(self) -> None:
+        items: Tuple[Tuple[str, int], ...] = ()
+        try:
+            if self._phases:
+                items = phase_items(self._phases, self.db_path)
+        except Exception:
+            items = ()
+        try:
+            if self.db_path:
+                with closing(connect(self.db_path, readonly=True)) as con:
+                    rec = type(self._projects)(con).get_project(self._project_id)
+            else:
+                rec = self._projects.get_project(self._project_id)
+        except Exception:
+            rec = None
+        self.signals.fetched.emit(items, rec)
+
+
+class _SaveSignals(QObject):
+    saved = Signal(str, int, int, bool)     # error ("" if none), phase now, priority now, changed
+
+
+class _SaveJob(QRunnable):
+    """
+    Applies phase, then priority, then a note-only entry; stops at the first failure.
+    On the pool it writes through a connection of its own (db_path); without a database
+    file it is run on the GUI thread.
+    """
+
+    def __init__(self, projects_repo, project_id: int, old_phase: int, old_prio: int,
+                 new_phase: int, new_prio: int, note: Optional[str], db_path: str = "") -> None:
+        super().__init__()
+        self._projects = projects_repo
+        self.db_path = db_path
+        self._project_id = project_id
+        self._old = (old_phase, old_prio)
+        self._new = (new_phase, new_prio)
+        self._note = note
+        self.signals = _SaveSignals()
+
+    def run(self) -> None:
+        if not self.db_path:
+            self._apply(self._projects)
+            return
+        try:
+            con = connect(self.db_path)
+        except Exception:
+            self.signals.saved.emit("database", *self._old, False)
+            return
+        with closing(con):
+            self._apply(type(self._projects)(con))
+
+    def _apply(self, projects) -> None:
+        (phase, prio), (new_phase, new_prio) = self._old, self._new
+        note = self._note
+        changed = False
+
+        # Phase change first (so transitions are validated)
+        if new_phase != phase:
+            try:
+                ok = projects.set_project_phase(self._project_id, new_phase, note=note or "Changed via editor")
+            except Exception:
+                ok = False
+            if not ok:
+                self.signals.saved.emit("phase", phase, prio, changed)
+                return
+            phase, changed = new_phase, True
+
+        # Priority change
+        if new_prio != prio:
+            try:
+                ok = projects.set_project_priority(self._project_id, new_prio, note=note or "Changed via editor")
+            except Exception:
+                ok = False
+            if not ok:
+                self.signals.saved.emit("priority", phase, prio, changed)
+                return
+            prio, changed = new_prio, True
+
+        # Note-only entry (no field changes)
+        if not changed and note:
+            try:
+                projects.add_project_note(self._project_id, note=note)
+                changed = True
+            except Exception:
+                pass
+
+        self.signals.saved.emit("", phase, prio, changed)
+
+
 class ProjectEditorDialog(QDialog):
     """
     Matches the visual/UX of Task/Subtask editors:
       Name (read-only), Description (read-only), <hr/>, Phase, Priority, Note, OK/Cancel.
 
-    Behavior is unchanged: this dialog still applies updates via projects_repo in _apply().
+    Behavior is unchanged: this dialog still applies updates via projects_repo (_apply -> _SaveJob).
     """
 
     def __init__(self, *, project_id: int, projects_repo, phases_repo=None, parent: QWidget | None = None):
@@ -28,6 +139,18 @@ class ProjectEditorDialog(QDialog):
         self._project_id = project_id
         self._projects = projects_repo
         self._phases = phases_repo
+        # Jobs open their own connections on this file ("" = in-memory: they run on the GUI thread)
+        self._db_path = database_path(projects_repo)
+        self._saving = False
+
+        # Values as loaded into the form; _apply diffs against these instead of re-querying
+        self._rec_loaded = False
+        self._old_phase = 1
+        self._old_prio = 2
+
+        # id -> combo row, filled by the _populate_* helpers
+        self._phase_index: Dict[int, int] = {}
+        self._prio_index: Dict[int, int] = {}
 
         # ---- Controls ----
         # Read-only project identity (to match other editors)
@@ -45,12 +168,9 @@ class ProjectEditorDialog(QDialog):
         self._txt_note.setAcceptRichText(False)
         self._txt_note.setPlaceholderText("Optional note (will be recorded in the project timeline)")
 
-        # Populate combos
-        self._populate_phase_items()
+        # Priorities are constants; phases + current DB values arrive from _EditorFetchJob
         self._populate_priority_items()
-
-        # Load current DB values (fills name/desc + selects combos)
-        self._load_current_values()
+        self._name.setPlaceholderText("Loading…")
 
         # ---- Layout (match Task/Subtask editors) ----
         form = QFormLayout()
@@ -64,6 +184,9 @@ class ProjectEditorDialog(QDialog):
         btns = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         btns.accepted.connect(self._apply)
         btns.rejected.connect(self.reject)
+        self._btns = btns
+        self._btn_ok = btns.button(QDialogButtonBox.Ok)
+        self._btn_ok.setEnabled(False)      # until the record is loaded
 
         lay = QVBoxLayout(self)
         lay.addLayout(form)
@@ -71,14 +194,24 @@ class ProjectEditorDialog(QDialog):
 
         lock_dialog_fixed(self, width_ratio=0.5, height_ratio=0.6)
 
+        job = _EditorFetchJob(self)
+        job.signals.fetched.connect(self._on_fetched)
+        self._start(job)
+
+    def _start(self, job: QRunnable) -> None:
+        if job.db_path:
+            QThreadPool.globalInstance().start(job)
+        else:
+            job.run()   # in-memory database: only the shared connection can see it
+
     # ----- data -----
-    def _load_current_values(self):
-        rec: Optional[Dict] = None
-        try:
-            rec = self._projects.get_project(self._project_id)
-        except Exception:
-            rec = None
+    def _on_fetched(self, phase_items: Tuple[Tuple[str, int], ...], rec: Optional[Dict]):
+        self._populate_phase_items(phase_items)
+        self._load_current_values(rec)
+        self._btn_ok.setEnabled(True)
 
+    def _load_current_values(self, rec: Optional[Dict]):
+        self._name.setPlaceholderText("")
         if not rec:
             # Graceful fallback
             self._name.setText("(project not found)")
@@ -92,34 +225,34 @@ class ProjectEditorDialog(QDialog):
         # Preselect combos to current values
         phase_id = int(rec.get("phase_id", 1))
         prio_id = int(rec.get("priority_id", 2))
+        self._rec_loaded = True
+        self._old_phase = phase_id
+        self._old_prio = prio_id
 
-        i = self._cmb_phase.findData(phase_id)
+        i = self._phase_index.get(phase_id, -1)
         if i >= 0:
             self._cmb_phase.setCurrentIndex(i)
 
-        j = self._cmb_priority.findData(prio_id)
+        j = self._prio_index.get(prio_id, -1)
         if j >= 0:
             self._cmb_priority.setCurrentIndex(j)
 
-    def _populate_phase_items(self):
+    def _populate_phase_items(self, items: Tuple[Tuple[str, int], ...]):
         # Prefer dynamic list from phases_repo; fallback to constants
-        items: list[tuple[str, int]] = []
-        try:
-            if self._phases:
-                for p in self._phases.list_phases():
-                    items.append((p["name"], int(p["id"])))
-        except Exception:
-            items = []
         if not items:
             items = [(name, pid) for pid, name in _PHASE_NAMES.items()]
 
         self._cmb_phase.clear()
+        self._phase_index = {}
         for name, pid in items:
+            self._phase_index[pid] = self._cmb_phase.count()
             self._cmb_phase.addItem(name, pid)
 
     def _populate_priority_items(self):
         self._cmb_priority.clear()
+        self._prio_index = {}
         for pid, name in _PRIORITY_NAMES.items():
+            self._prio_index[pid] = self._cmb_priority.count()
             self._cmb_priority.addItem(name, pid)
 
     # ----- actions -----
@@ -129,62 +262,53 @@ class ProjectEditorDialog(QDialog):
         new_prio = int(self._cmb_priority.currentData())
         note = (self._txt_note.toPlainText().strip() or None)
 
-        # Load current to detect actual changes
-        rec = self._projects.get_project(self._project_id)
-        if not rec:
+        # Detect actual changes against the values loaded into the form
+        if not self._rec_loaded:
             QMessageBox.warning(self, "Update failed", "Project not found.")
             return
 
-        old_phase = int(rec.get("phase_id", 1))
-        old_prio = int(rec.get("priority_id", 2))
-
-        changed = False
-
-        # Phase change first (so transitions are validated)
-        if new_phase != old_phase:
-            ok = False
-            try:
-                ok = self._projects.set_project_phase(
-                    self._project_id,
-                    new_phase,
-                    note=note or "Changed via editor",
-                )
-            except Exception:
-                ok = False
-            if not ok:
-                QMessageBox.warning(
-                    self,
-                    "Phase change blocked",
-                    "That phase change is not allowed by the configured transitions.",
-                )
-                return
-            changed = True
-
-        # Priority change
-        if new_prio != old_prio:
-            ok = False
-            try:
-                ok = self._projects.set_project_priority(
-                    self._project_id,
-                    new_prio,
-                    note=note or "Changed via editor",
-                )
-            except Exception:
-                ok = False
-            if not ok:
-                QMessageBox.warning(self, "Priority update failed", "Could not update project priority.")
-                return
-            changed = True
-
-        # Note-only entry (no field changes)
-        if not changed and note:
-            try:
-                self._projects.add_project_note(self._project_id, note=note)
-                changed = True
-            except Exception:
-                pass
+        self._btns.setEnabled(False)      # until _on_saved
+        self._saving = True               # reject()/closeEvent ignored until then
+        job = _SaveJob(self._projects, self._project_id, self._old_phase, self._old_prio,
+                       new_phase, new_prio, note, self._db_path)
+        job.signals.saved.connect(self._on_saved)
+        self._start(job)
+
+    def _on_saved(self, error: str, phase_id: int, prio_id: int, changed: bool):
+        self._saving = False
+        self._btns.setEnabled(True)
+        # keep the baseline true if a later step failed
+        self._old_phase = phase_id
+        self._old_prio = prio_id
+
+        if error == "phase":
+            QMessageBox.warning(
+                self,
+                "Phase change blocked",
+                "That phase change is not allowed by the configured transitions.",
+            )
+            return
+        if error == "priority":
+            QMessageBox.warning(self, "Priority update failed", "Could not update project priority.")
+            return
+        if error:
+            QMessageBox.warning(self, "Update failed", "Could not open the database.")
+            return
 
         if changed:
             self.accept()
         else:
             self.reject()
+
+    # ----- close guards -----
+    def reject(self):
+        # Esc / Cancel while a save is in flight: the result is still coming
+        if self._saving:
+            return
+        super().reject()
+
+    def closeEvent(self, event):
+        if self._saving:
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -28,6 +28,9 @@ class ProjectListView(QWidget):
         src = self._proxy.mapToSource(index) if self._proxy else index
         # Prefer UserRole (robust even if columns move/hide)
         pid = self._model.data(src, Qt.UserRole)
+        if isinstance(pid, int):
+            self.projectActivated.emit(pid)   # model already stores native ids
+            return
         if pid is None:
             pid = self._model.data(self._model.index(src.row(), 0))  # fallback to col 0 text
         try:
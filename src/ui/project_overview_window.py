@@ -1,16 +1,13 @@
-# Rev 0.6.8
 # Rev 0.6.8 — Overview: proper maximize, no geometry persistence, no setLayout on QMainWindow
-from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QLabel
+from typing import Callable, Dict, Optional, Set
 
-from viewmodels.project_overview_viewmodel import ProjectOverviewViewModel
+from PySide6.QtCore import Qt, QSettings, QSignalBlocker
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget
+
+from viewmodels.project_overview_viewmodel import ProjectOverviewViewModel, ProjectInfo
+from ui.tabs import tab_class
 from ui.tabs.overview_tab import OverviewTab
-from ui.tabs.tasks_tab import TasksTab
-from ui.tabs.subtasks_tab import SubtasksTab
-from ui.tabs.attachments_tab import AttachmentsTab
-from ui.tabs.expenses_tab import ExpensesTab
-from ui.tabs.history_tab import HistoryTab
-from ui.window_mode import lock_maximized
+from ui.window_mode import lock_to_screen
 
 
 class ProjectOverviewWindow(QMainWindow):
@@ -37,75 +34,114 @@ class ProjectOverviewWindow(QMainWindow):
 
         # ---- Central widget (QMainWindow must use a central widget; do NOT call setLayout on self) ----
         self._tabs = QTabWidget(self)
+        # Overview is built now (header/counts from the VM land on it); the other tabs
+        # are built on first activation, a placeholder holding each slot until then.
         self._tab_overview = OverviewTab(self._projects_repo, self._tasks_repo, self._subtasks_repo, self._phases_repo, self)
-        self._tab_tasks = TasksTab(tasks_repo, phases_repo)
-        self._tab_subtasks = SubtasksTab(subtasks_repo)
-        self._tab_attachments = AttachmentsTab()
-        self._tab_expenses = ExpensesTab()
-        self._tab_history = HistoryTab()
-
+        self._tab_factories: Dict[int, Callable[[], QWidget]] = {
+            1: lambda: tab_class("ui.tabs.tasks_tab", "TasksTab")(self._tasks_repo, self._phases_repo),
+            2: lambda: tab_class("ui.tabs.subtasks_tab", "SubtasksTab")(self._subtasks_repo),
+            3: lambda: tab_class("ui.tabs.attachments_tab", "AttachmentsTab")(),   # scaffold
+            4: lambda: tab_class("ui.tabs.expenses_tab", "ExpensesTab")(),         # scaffold
+            5: lambda: tab_class("ui.tabs.history_tab", "HistoryTab")(),           # scaffold
+        }
         self._tabs.addTab(self._tab_overview, "Overview")
-        self._tabs.addTab(self._tab_tasks, "Tasks")
-        self._tabs.addTab(self._tab_subtasks, "Subtasks")
-        self._tabs.addTab(self._tab_attachments, "Attachments")
-        self._tabs.addTab(self._tab_expenses, "Expenses")
-        self._tabs.addTab(self._tab_history, "History")
-
-        self._hdr = QLabel("")              # reserved header (keeps spacing if your stylesheet expects it)
-        self._hdr.setObjectName("projectHeader")
+        for label in ("Tasks", "Subtasks", "Attachments", "Expenses", "History"):
+            self._tabs.addTab(QWidget(), label)
+
+        # Per-index loaders (registered as tabs are built); a tab is loaded the
+        # first time it is shown for the current project. Overview has none: it is
+        # filled from the VM bundle in _on_loaded (one query instead of ~10).
+        self._tab_loaders: Dict[int, Callable[[int], None]] = {}
+        self._tab_loaded: Set[int] = set()
+
+        # Restore the last viewed tab before wiring currentChanged: load() below loads only it
+        try:
+            last_tab = int(QSettings("trackerZ", "ui").value("overview_last_tab", 0))
+        except (TypeError, ValueError):
+            last_tab = 0
+        if 0 <= last_tab < self._tabs.count():
+            self._tabs.setCurrentIndex(last_tab)
+        self._tabs.currentChanged.connect(self._ensure_tab_loaded)
 
         root = QWidget(self)
         lay = QVBoxLayout(root)
-        lay.addWidget(self._hdr)
+        lay.addSpacing(self.fontMetrics().height())   # reserved header row (was an always-empty QLabel)
         lay.addWidget(self._tabs)
         self.setCentralWidget(root)
 
-        # Defer maximize so it wins over any initial sizing or WM geometry
-        QTimer.singleShot(0, lambda: lock_maximized(self, lock_resize=True))
-
         # Wire VM
         self._vm.loaded.connect(self._on_loaded)
+        if hasattr(self._tab_overview, "projectEdited"):
+            self._tab_overview.projectEdited.connect(self._vm.invalidate)
 
         # Initial load
         self.load(self._project_id)
 
+        # Opens maximized whenever the caller shows it: the first layout pass is at the
+        # final size. The size lock needs the screen it opens on (showEvent).
+        self._size_locked = False
+        self.setWindowState(self.windowState() | Qt.WindowMaximized)
+
     # ---------------- Public API ----------------
     def load(self, project_id: int):
         self._project_id = project_id
-        self._vm.load(project_id)
+        cached = self._vm.cached(project_id)
+        if cached:
+            self._on_loaded(cached)       # stale-but-close header until the refresh lands
+        self._vm.load_async(project_id)   # title + counts arrive via _on_loaded
 
-        self._tab_overview.load(project_id)
-        self._tab_tasks.load(project_id, phase_id=None)
-        self._tab_subtasks.load(project_id)
-        self._tab_history.load(project_id)        # scaffold
-        self._tab_attachments.load(project_id)    # scaffold
-        self._tab_expenses.load(project_id)       # scaffold
+        self._tab_loaded.clear()
+        self._ensure_tab_loaded(self._tabs.currentIndex())
 
     # ---------------- Slots ----------------
-    def _on_loaded(self, info: dict):
+    def _ensure_tab_loaded(self, idx: int):
+        if idx in self._tab_factories:
+            self._materialize_tab(idx)
+        if idx in self._tab_loaded:
+            return
+        loader = self._tab_loaders.get(idx)
+        if loader is None:
+            return
+        self._tab_loaded.add(idx)
+        loader(self._project_id)
+
+    def _materialize_tab(self, idx: int):
+        real = self._tab_factories.pop(idx)()
+        placeholder = self._tabs.widget(idx)
+        label = self._tabs.tabText(idx)
+        with QSignalBlocker(self._tabs):
+            self._tabs.removeTab(idx)
+            self._tabs.insertTab(idx, real, label)
+            self._tabs.setCurrentIndex(idx)
+        placeholder.deleteLater()
+        self._tab_loaders[idx] = real.load
+
+    def _on_loaded(self, info: Optional[ProjectInfo]):
         # Window title only; Overview tab renders the details
-        if info:
-            pid = info.get("id")
-            name = info.get("name") or ""
-            self.setWindowTitle(f"{name} — Project {pid}")
+        if info is not None:
+            self.setWindowTitle(f"{info.name} — Project {info.id}")
         else:
             self.setWindowTitle("Project")
 
         if hasattr(self._tab_overview, "set_info"):
-            self._tab_overview.set_info(info or {"id": "—", "name": "Unknown Project", "description": ""})
+            self._tab_overview.set_info(info)
 
         if hasattr(self._tab_overview, "set_counts"):
             self._tab_overview.set_counts({
-                "tasks_total": int(info.get("tasks_total", 0)) if info else 0,
-                "subtasks_total": int(info.get("subtasks_total", 0)) if info else 0,
+                "tasks_total": info.tasks_total if info else 0,
+                "subtasks_total": info.subtasks_total if info else 0,
+                "tasks_by_phase": info.tasks_by_phase if info else {},
             })
 
     # ---------------- Qt Overrides ----------------
     # No geometry persistence; maximize lock controls size.
     # Keep save/restore for splitters/headers elsewhere if you use them.
+    def showEvent(self, e):
+        if not self._size_locked:
+            self._size_locked = True
+            lock_to_screen(self)
+        super().showEvent(e)
 
-
-    # ---------------- Qt Overrides ----------------
     def closeEvent(self, e):
-        QSettings().setValue("overview/geometry", self.saveGeometry())
+        QSettings("trackerZ", "ui").setValue("overview_last_tab", self._tabs.currentIndex())
         super().closeEvent(e)
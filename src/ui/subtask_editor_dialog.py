@@ -12,6 +12,9 @@ from ui.window_mode import lock_dialog_fixed
 
 _PHASE_NAMES = {1: "Open", 2: "In Progress", 3: "In Hiatus", 4: "Resolved", 5: "Closed"}
 _PRIORITY_NAMES = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
+# id -> combo row; the combos are filled in dict order below
+_PHASE_INDEX = {pid: i for i, pid in enumerate(_PHASE_NAMES)}
+_PRIORITY_INDEX = {pid: i for i, pid in enumerate(_PRIORITY_NAMES)}
 
 
 class SubtaskEditorDialog(QDialog):
@@ -54,16 +57,12 @@ class SubtaskEditorDialog(QDialog):
         self._cmb_phase = QComboBox()
         for pid, label in _PHASE_NAMES.items():
             self._cmb_phase.addItem(label, pid)
-        ix = self._cmb_phase.findData(phase_id or 1)
-        if ix >= 0:
-            self._cmb_phase.setCurrentIndex(ix)
+        self._cmb_phase.setCurrentIndex(_PHASE_INDEX.get(phase_id or 1, 0))
 
         self._cmb_priority = QComboBox()
         for prio, label in _PRIORITY_NAMES.items():
             self._cmb_priority.addItem(label, prio)
-        jx = self._cmb_priority.findData(priority_id or 2)
-        if jx >= 0:
-            self._cmb_priority.setCurrentIndex(jx)
+        self._cmb_priority.setCurrentIndex(_PRIORITY_INDEX.get(priority_id or 2, 0))
 
         self._note = QTextEdit(note or "")
         self._note.setAcceptRichText(False)
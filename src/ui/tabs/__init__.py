@@ -1 +1,7 @@
 # Rev 0.0.1
+import importlib
+
+
+def tab_class(module: str, name: str):
+    """Import a tab class when its tab is first built (keeps tab modules off the host's import)."""
+    return getattr(importlib.import_module(module), name)
@@ -1,11 +1,29 @@
 # Rev 0.6.8 — show Project Phase & Priority (schema Rev 1.1.0)
-from PySide6.QtCore import Qt
+import datetime as _datetime
+import sqlite3
+
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QFormLayout,
     QGroupBox, QGridLayout, QSizePolicy, QHBoxLayout
 )
 
+_UNSET = object()   # "not looked up yet" (None means looked up, not found)
+
+
 class OverviewTab(QWidget):
+    projectEdited = Signal(int)   # project_id, after the editor dialog saved a change
+
+    # Index = id; slot 0 is the placeholder for unknown/missing ids
+    _PHASES = ("—", "Open", "In Progress", "In Hiatus", "Resolved", "Closed")
+    _PRIORITIES = ("—", "Low", "Medium", "High", "Critical")
+
+    _AGGREGATES_SQL = (
+        "SELECT 'phase', phase_id, COUNT(*) FROM tasks WHERE project_id = ? GROUP BY phase_id "
+        "UNION ALL "
+        "SELECT 'subs', NULL, COUNT(*) FROM subtasks s JOIN tasks t ON t.id = s.task_id WHERE t.project_id = ?"
+    )
+
     def __init__(self, projects_repo, tasks_repo, subtasks_repo, phases_repo=None, parent=None):
         super().__init__(parent)
         self._projects = projects_repo
@@ -13,7 +31,14 @@ class OverviewTab(QWidget):
         self._subtasks = subtasks_repo
         self._phases = phases_repo
         self._project_id = None
-        self._phase_ids = {}
+        self._cached_conn = None     # resolved on first use; the repos (and their DB) are fixed per tab
+        self._updates_table = _UNSET  # schema is fixed at runtime: resolved once with the connection
+        self._sql_updated = None
+        self._fields_version = None   # (project_id, updated_at_utc) the labels were last filled from
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
         self._init_ui()
 
     def _init_ui(self):
@@ -89,156 +114,182 @@ class OverviewTab(QWidget):
 
     # ---------- Public API ----------
     def load(self, project_id: int):
+        self._refresh_timer.stop()
         self._project_id = project_id
-        self._ensure_phase_ids()
-        self._load_project_fields()
+        self._load_project_fields(force=True)
         self._load_aggregates()
 
+    def set_info(self, info):
+        """Render project fields from a prefetched ProjectInfo (ProjectOverviewViewModel.loaded)."""
+        self._fields_version = None   # labels no longer come from _load_project_fields
+        if info is None:
+            self._project_id = None
+            self._lbl_id.setText("—")
+            self._lbl_name.setText("Unknown Project")
+            self._lbl_desc.setText("")
+            for lbl in (self._lbl_created, self._lbl_updated, self._lbl_phase, self._lbl_priority):
+                lbl.setText("—")
+            return
+        self._project_id = info.id
+        self._lbl_id.setText(str(info.id))
+        self._lbl_name.setText(info.name)
+        self._lbl_desc.setText(info.description or "")
+        self._lbl_created.setText(self._fmt_ts(info.created_at_utc))
+        self._lbl_updated.setText(self._fmt_ts(info.updated_at_utc))
+        self._lbl_phase.setText(self._fmt_phase(info.phase_id))
+        self._lbl_priority.setText(self._priority_label(info.priority_id))
+
+    def set_counts(self, counts: dict):
+        """Render aggregates from a prefetched dict: tasks_total, subtasks_total, tasks_by_phase."""
+        self._lbl_tasks_total.setText(str(counts.get("tasks_total", 0)))
+        self._lbl_subtasks_total.setText(str(counts.get("subtasks_total", 0)))
+        by_phase = counts.get("tasks_by_phase") or {}
+        for phase_id, lbl in (
+            (1, self._lbl_tasks_open),
+            (2, self._lbl_tasks_inprog),
+            (3, self._lbl_tasks_hiatus),
+            (4, self._lbl_tasks_resolved),
+            (5, self._lbl_tasks_closed),
+        ):
+            lbl.setText(str(by_phase.get(phase_id, 0)))
+
     @staticmethod
     def _fmt_ts(ts: str | None) -> str:
         if not ts:
             return "—"
-        import datetime
+        # Not YYYY-MM-DD…: shown as stored, without raising inside fromisoformat
+        if len(ts) < 10 or ts[4] != "-" or ts[7] != "-":
+            return ts
+        if ts.endswith("Z"):
+            ts = ts[:-1]
         try:
-            if ts.endswith("Z"):
-                ts = ts[:-1]
-            dt = datetime.datetime.fromisoformat(ts)
-            return dt.strftime("%b %d %Y %H:%M UTC")
-        except Exception:
+            dt = _datetime.datetime.fromisoformat(ts)
+        except ValueError:
             return ts
+        return dt.strftime("%b %d %Y %H:%M UTC")
 
     def _refresh_clicked(self):
+        self._refresh_timer.start()   # restarts on each click: rapid clicks coalesce
+
+    def _do_refresh(self):
         if self._project_id is not None:
             self._load_project_fields()
             self._load_aggregates()
 
     # ---------- Data loading ----------
     def _get_project_row(self, project_id: int):
-        conn = self._conn_for(self._projects) or self._conn_for(self._tasks)
+        conn = self._get_conn()
         if not conn:
             return None
         cur = conn.cursor()
+        cur.row_factory = sqlite3.Row   # name access in C; set on this cursor only, the shared connection is untouched
         # include phase_id, priority_id
         cur.execute(
             "SELECT id, name, description, created_at_utc, phase_id, priority_id FROM projects WHERE id = ?",
             (project_id,),
         )
-        row = cur.fetchone()
-        if not row:
-            return None
-        cols = [d[0] for d in cur.description]
-        return dict(zip(cols, row))
+        return cur.fetchone()
 
     def _get_project_updated_utc(self, project_id: int) -> str:
-        conn = self._conn_for(self._projects) or self._conn_for(self._tasks)
+        conn = self._get_conn()
         if not conn:
             return ""
         cur = conn.cursor()
-        table_name = None
-        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'project%update%';")
-        found = cur.fetchone()
-        if found:
-            table_name = found[0]
-        if not table_name:
+        if self._updates_table is _UNSET:
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'project%update%';")
+            found = cur.fetchone()
+            self._updates_table = t = found[0] if found else None
+            if t:
+                # Constant text from here on: sqlite3's statement cache hits on every refresh
+                # created_at_utc fallback only where the table has one (project_updates does not)
+                cols = {r[1] for r in conn.execute(f"PRAGMA table_info({t})")}
+                latest = "COALESCE(MAX(updated_at_utc), MAX(created_at_utc))" if "created_at_utc" in cols else "MAX(updated_at_utc)"
+                self._sql_updated = f"SELECT {latest} FROM {t} WHERE project_id = ?"
+        if not self._updates_table:
             return ""
         try:
-            cur.execute(f"SELECT MAX(updated_at_utc) FROM {table_name} WHERE project_id = ?", (project_id,))
+            cur.execute(self._sql_updated, (project_id,))
             row = cur.fetchone()
-            if not row or not row[0]:
-                cur.execute(f"SELECT MAX(created_at_utc) FROM {table_name} WHERE project_id = ?", (project_id,))
-                row = cur.fetchone()
             return row[0] if row and row[0] else ""
         except Exception:
             return ""
 
     @staticmethod
     def _priority_label(pid: int | None) -> str:
-        names = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
-        return names.get(pid, "—")
+        return OverviewTab._PRIORITIES[pid] if pid is not None and 1 <= pid <= 4 else "—"
 
-    def _load_project_fields(self):
+    def _load_project_fields(self, force: bool = False):
+        # Every project edit writes a project_updates row, so an unchanged latest
+        # updated_at means unchanged fields: skip the row query and the label repaints
+        updated = self._get_project_updated_utc(self._project_id)
+        version = (self._project_id, updated)
+        if not force and updated and version == self._fields_version:
+            return
         p = self._get_project_row(self._project_id)
         if not p:
+            self._fields_version = None
             for lbl in (self._lbl_id, self._lbl_name, self._lbl_desc, self._lbl_created, self._lbl_updated, self._lbl_phase, self._lbl_priority):
                 lbl.setText("-")
             return
-        self._lbl_id.setText(str(p.get("id", "")))
-        self._lbl_name.setText(p.get("name", "") or "")
-        self._lbl_desc.setText(p.get("description", "") or "")
-        self._lbl_created.setText(self._fmt_ts(p.get("created_at_utc")))
-        self._lbl_updated.setText(self._fmt_ts(self._get_project_updated_utc(self._project_id)))
+        self._fields_version = version
+        self._lbl_id.setText(str(p["id"]))
+        self._lbl_name.setText(p["name"] or "")
+        self._lbl_desc.setText(p["description"] or "")
+        self._lbl_created.setText(self._fmt_ts(p["created_at_utc"]))
+        self._lbl_updated.setText(self._fmt_ts(updated))
 
         # New: show phase/priority
-        phase_id = p.get("phase_id")
+        phase_id = p["phase_id"]
         self._lbl_phase.setText(self._fmt_phase(phase_id))
-        self._lbl_priority.setText(self._priority_label(p.get("priority_id")))
+        self._lbl_priority.setText(self._priority_label(p["priority_id"]))
 
     # ---------- Aggregates (unchanged) ----------
     def _load_aggregates(self):
         pid = self._project_id
-        try:
-            total_tasks = self._tasks.count_tasks_total(project_id=pid)
-        except TypeError:
-            total_tasks = 0
-        self._lbl_tasks_total.setText(str(total_tasks))
-
-        conn = self._conn_for(self._tasks) or self._conn_for(self._projects)
+        conn = self._get_conn()
         if conn:
-            cur = conn.cursor()
-            def qcount(phase):
-                cur.execute("SELECT COUNT(*) FROM tasks WHERE project_id=? AND phase_id=?", (pid, phase))
-                r = cur.fetchone()
-                return int(r[0]) if r else 0
-            self._lbl_tasks_open.setText(str(qcount(1)))
-            self._lbl_tasks_inprog.setText(str(qcount(2)))
-            self._lbl_tasks_hiatus.setText(str(qcount(3)))
-            self._lbl_tasks_resolved.setText(str(qcount(4)))
-            self._lbl_tasks_closed.setText(str(qcount(5)))
-
-        total_subs = 0
-        if hasattr(self._subtasks, "count_subtasks_total_by_project"):
+            # One cursor for every aggregate: per-phase task counts (total = their sum)
+            # and the project's subtask count, told apart by the tag column
+            counts = {}
+            total_subs = 0
+            for tag, phase_id, n in conn.execute(self._AGGREGATES_SQL, (pid, pid)):
+                if tag == "subs":
+                    total_subs = n
+                else:
+                    counts[phase_id] = n
+            total_tasks = sum(counts.values())
+            self._lbl_tasks_open.setText(str(counts.get(1, 0)))
+            self._lbl_tasks_inprog.setText(str(counts.get(2, 0)))
+            self._lbl_tasks_hiatus.setText(str(counts.get(3, 0)))
+            self._lbl_tasks_resolved.setText(str(counts.get(4, 0)))
+            self._lbl_tasks_closed.setText(str(counts.get(5, 0)))
+        else:
             try:
-                total_subs = self._subtasks.count_subtasks_total_by_project(project_id=pid)
-            except Exception:
-                total_subs = 0
-        elif conn:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT COUNT(*)
-                FROM subtasks s
-                JOIN tasks t ON t.id = s.task_id
-                WHERE t.project_id = ?
-                """,
-                (pid,),
-            )
-            r = cur.fetchone()
-            total_subs = int(r[0]) if r else 0
-
+                total_tasks = self._tasks.count_tasks_total(project_id=pid)
+            except TypeError:
+                total_tasks = 0
+            total_subs = 0
+            if hasattr(self._subtasks, "count_subtasks_total_by_project"):
+                try:
+                    total_subs = self._subtasks.count_subtasks_total_by_project(project_id=pid)
+                except Exception:
+                    total_subs = 0
+        self._lbl_tasks_total.setText(str(total_tasks))
         self._lbl_subtasks_total.setText(str(total_subs))
 
     # ---------- Phase mapping ----------
-    def _ensure_phase_ids(self):
-        if self._phase_ids:
-            return
-        self._phase_ids.update({
-            "Open": 1,
-            "In Progress": 2,
-            "In Hiatus": 3,
-            "Resolved": 4,
-            "Closed": 5,
-        })
-
     def _fmt_phase(self, pid: int | None) -> str:
         if pid is None:
             return "—"
-        # Names are stable; mirror reverse map from _phase_ids
-        rev = {v: k for k, v in self._phase_ids.items()} if self._phase_ids else {
-            1: "Open", 2: "In Progress", 3: "In Hiatus", 4: "Resolved", 5: "Closed"
-        }
-        return rev.get(pid, "—")
+        # Names are stable: ids index straight into _PHASES
+        return self._PHASES[pid] if 1 <= pid <= 5 else "—"
 
     # ---------- Connection helper ----------
+    def _get_conn(self):
+        if self._cached_conn is None:
+            self._cached_conn = self._conn_for(self._projects) or self._conn_for(self._tasks)
+        return self._cached_conn
+
     def _conn_for(self, repo):
         if hasattr(repo, "_conn"):
             try:
@@ -268,7 +319,8 @@ class OverviewTab(QWidget):
             return
         dlg = ProjectEditorDialog(project_id=self._project_id, projects_repo=self._projects, phases_repo=self._phases, parent=self)
         if dlg.exec():
-            # refresh details after changes
-            self._load_project_fields()
+            # refresh details after changes (edits can land within the same second: no version gate)
+            self._load_project_fields(force=True)
             self._load_aggregates()
+            self.projectEdited.emit(self._project_id)
 
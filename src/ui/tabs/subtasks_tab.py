@@ -1,18 +1,192 @@
 # Rev 0.7.0 — Bottom-center History panel + coalesced timeline for Subtasks
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
+from contextlib import closing
 from datetime import datetime
 
-from PySide6.QtCore import Qt, QSettings
+from PySide6.QtCore import (
+    Qt, QSettings, QSignalBlocker, Signal, QObject, QRunnable, QThreadPool,
+    QModelIndex, QAbstractTableModel, QTimer
+)
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QPushButton,
+    QTableView, QAbstractItemView, QHeaderView, QPushButton,
     QMessageBox, QDialog, QSplitter
 )
 
 from ui.subtask_editor_dialog import SubtaskEditorDialog
 from ui.panels.history_panel import HistoryPanel
 from repositories.sqlite_subtask_updates_repository import SQLiteSubtaskUpdatesRepository
+from repositories.db import connect, database_path
+from models.entities import HistoryUpdate
+
+_PREFETCH_BEHIND, _PREFETCH_AHEAD = 1, 2     # rows around the selection whose timelines are warmed
+_PREFETCH_MAX_IN_FLIGHT = 3
+
+
+class _SubtasksModel(QAbstractTableModel):
+    """Holds the filtered row dicts as-is; data() formats only the cells the view asks for."""
+
+    _HEADERS = ("ID", "Task", "Name", "Phase", "Priority")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[dict] = []
+        self._task_names: Dict[int, str] = {}
+
+    def set_rows(self, rows: List[dict], task_names: Dict[int, str]) -> None:
+        # Recycle existing rows instead of resetting the model (same scheme as _TasksModel)
+        names_changed = task_names != self._task_names
+        self._task_names = task_names
+        n_old, n_new = len(self._rows), len(rows)
+        common = min(n_old, n_new)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._rows[n_new:]
+            self.endRemoveRows()
+        changed = [r for r in range(common) if names_changed or self._rows[r] != rows[r]]
+        if changed:
+            self._rows[:common] = rows[:common]
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], len(self._HEADERS) - 1))
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._rows.extend(rows[n_old:])
+            self.endInsertRows()
+
+    def append_rows(self, rows: List[dict]) -> None:
+        if not rows:
+            return
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def sid_at(self, row: int) -> Optional[int]:
+        if not 0 <= row < len(self._rows):
+            return None
+        return _subtask_id(self._rows[row])
+
+    def row_of(self, sid: int) -> int:
+        for r, row in enumerate(self._rows):
+            if _subtask_id(row) == sid:
+                return r
+        return -1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.UserRole:
+            return _subtask_id(row)
+        if role != Qt.DisplayRole:
+            return None
+        col = index.column()
+        if col == 0:
+            sid = _subtask_id(row)
+            return str(sid) if sid is not None else ""
+        if col == 1:
+            task_id = row.get("task_id")
+            return self._task_names.get(task_id, f"Task {task_id}")
+        if col == 2:
+            return row.get("name") or ""
+        if col == 3:
+            return row.get("phase_name") or SubtasksTab._phase_label(row.get("phase_id"))
+        return SubtasksTab._priority_label(row.get("priority_id"))
+
+
+def _subtask_id(row: dict) -> Optional[int]:
+    sid = row.get("id") or row.get("subtask_id")
+    return int(sid) if sid is not None else None
+
+
+class _PrefetchSignals(QObject):
+    fetched = Signal(int, int, object)      # cache generation, subtask_id, [HistoryUpdate]
+
+
+class _TimelinePrefetchJob(QRunnable):
+    """Reads a timeline off the GUI thread, on a read-only connection of its own, for a row the user is likely to select next."""
+
+    def __init__(self, tab: "SubtasksTab", generation: int, sid: int) -> None:
+        super().__init__()
+        self._db_path = tab._db_path
+        self._build = tab._build_timeline
+        self._generation = generation
+        self._sid = sid
+        self.signals = _PrefetchSignals()
+
+    def run(self) -> None:
+        try:
+            with closing(connect(self._db_path, readonly=True)) as con:
+                raw = SQLiteSubtaskUpdatesRepository(con).list_updates_for_subtask(self._sid, order_desc=True)
+            updates = self._build(raw)
+        except Exception:
+            updates = None
+        self.signals.fetched.emit(self._generation, self._sid, updates)
+
+
+class _SaveSignals(QObject):
+    saved = Signal(int, str)                # subtask_id, error ("" if none)
+
+
+class _SubtaskSaveJob(QRunnable):
+    """
+    Applies phase, then priority, then a note-only entry. On the pool it writes through
+    a connection of its own (db_path); without a database file it is run on the GUI thread.
+    """
+
+    def __init__(self, repo, sid: int, rec: dict, phase_id: int, priority_id: int, note: Optional[str],
+                 db_path: str = "") -> None:
+        super().__init__()
+        self._repo = repo
+        self.db_path = db_path
+        self._sid = sid
+        self._old = (int(rec.get("phase_id", 1)), int(rec.get("priority_id", 2)))
+        self._new = (int(phase_id), int(priority_id))
+        self._note = note
+        self.signals = _SaveSignals()
+
+    def run(self) -> None:
+        error = ""
+        try:
+            if self.db_path:
+                with closing(connect(self.db_path)) as con:
+                    self._apply(type(self._repo)(con))
+            else:
+                self._apply(self._repo)
+        except Exception as e:
+            error = str(e)
+        self.signals.saved.emit(self._sid, error)
+
+    def _apply(self, repo) -> None:
+        (old_phase, old_prio), (phase_id, priority_id) = self._old, self._new
+        sid, note = self._sid, self._note
+        if hasattr(repo, "apply_subtask_changes"):
+            # one transaction: phase + priority (+ note) commit together
+            repo.apply_subtask_changes(sid, phase_id=phase_id, priority_id=priority_id, note=note or None)
+            return
+        # Apply only what changed
+        changed = False
+        if phase_id != old_phase:
+            changed = repo.change_subtask_phase(sid, phase_id, reason="phase_change", note=note or None)
+        if priority_id != old_prio:
+            changed = repo.set_subtask_priority(sid, priority_id, note=note or None) or changed
+        if note and not changed:
+            # record a note without other changes
+            try:
+                repo.update_subtask_fields(sid, note=note)
+            except Exception:
+                pass
 
 
 class SubtasksTab(QWidget):
@@ -24,12 +198,27 @@ class SubtasksTab(QWidget):
         self._repo = subtasks_repo
         self._project_id: Optional[int] = None
         self._all_rows: List[dict] = []
+        self._rows_by_task: Dict[int, List[dict]] = {}   # task_id -> its rows, in _all_rows order
+        self._tasks_list: List[Tuple[int, str]] = []   # (task_id, task_name), id order from SQL
         self._tasks_by_id: dict[int, str] = {}  # task_id -> task_name
+        self._subtask_counts_by_task: Dict[int, int] = {}   # task_id -> subtask count (0 for empty tasks)
+        self._stream = None   # batches still to fetch past the first one (repo iter_subtasks_for_project)
+
+        # Each tick appends one streamed batch, then yields to the event loop (paints, input)
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.setInterval(0)
+        self._stream_timer.timeout.connect(self._pump_stream)
 
         # Top controls
         self._task_filter = QComboBox()
         self._task_filter.addItem("All tasks", userData=None)
-        self._task_filter.currentIndexChanged.connect(self._apply_filter)
+        # Debounce filter changes: arrowing through the combo only renders the final pick
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self._task_filter.currentIndexChanged.connect(self._filter_timer.start)
 
         self._btn_new = QPushButton("New Subtask")
         self._btn_edit = QPushButton("Edit")
@@ -42,24 +231,26 @@ class SubtasksTab(QWidget):
         self._btn_delete.clicked.connect(self._on_delete)
 
         # Table: ID | Task | Name | Phase | Priority
-        self._table = QTableWidget(0, 5)
-        self._table.setHorizontalHeaderLabels(["ID", "Task", "Name", "Phase", "Priority"])
-        self._table.setSelectionBehavior(QTableWidget.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SingleSelection)
-        self._table.itemSelectionChanged.connect(self._on_selection_changed)
-
+        self._model = _SubtasksModel(self)
+        self._rendering = False   # _render() restoring the selection; handler runs once at the end
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._table.selectionModel().selectionChanged.connect(self._on_selection_changed)
+
+        # Widths set once (user-resizable); Name takes the rest. No content measuring per reload.
         hdr = self._table.horizontalHeader()
-        for col, mode in (
-            (0, QHeaderView.ResizeToContents),
-            (1, QHeaderView.ResizeToContents),
-            (2, QHeaderView.Stretch),
-            (3, QHeaderView.ResizeToContents),
-            (4, QHeaderView.ResizeToContents),
-        ):
-            hdr.setSectionResizeMode(col, mode)
+        hdr.setStretchLastSection(False)
+        for col, width in ((0, 60), (1, 180), (3, 110), (4, 90)):
+            hdr.setSectionResizeMode(col, QHeaderView.Interactive)
+            self._table.setColumnWidth(col, width)
+        hdr.setSectionResizeMode(2, QHeaderView.Stretch)
 
         vh = self._table.verticalHeader()
         vh.setVisible(False)
+        vh.setSectionResizeMode(QHeaderView.Fixed)  # fixed row height: no per-row height probing
         vh.setDefaultSectionSize(22)
         vh.setMinimumSectionSize(18)
         self._table.setWordWrap(False)
@@ -97,6 +288,12 @@ class SubtasksTab(QWidget):
 
         # Updates repo cache
         self._updates_repo: Optional[SQLiteSubtaskUpdatesRepository] = None
+        # Database file the pool jobs open their own connections to ("" for in-memory: no workers)
+        self._db_path = database_path(subtasks_repo)
+        # subtask_id -> decorated timeline; reselecting a row does not re-query
+        self._timeline_cache: Dict[int, List[HistoryUpdate]] = {}
+        self._cache_gen = 0                      # bumped on invalidation; stale prefetches are dropped
+        self._prefetching: Set[int] = set()
 
     # ---------- lifecycle (persist splitter sizes) ----------
     def showEvent(self, ev):
@@ -119,36 +316,97 @@ class SubtasksTab(QWidget):
     # ---------- public API ----------
     def load(self, project_id: int):
         self._project_id = project_id
-        # Fetch tasks & subtasks
-        self._refresh_task_names_cache(project_id)
-        self._all_rows = self._repo.list_subtasks_for_project(project_id)
+        self._invalidate_timelines()
+        self._fetch_rows(project_id, with_tasks=True)
         self._populate_task_filter()
+        self._filter_timer.stop()
         self._apply_filter()
         # Clear history panel until a row is selected
         self._history.set_updates([])
 
     # ---------- filter & render ----------
-    def _populate_task_filter(self):
-        prev_tid = self._task_filter.currentData()
-
-        self._task_filter.blockSignals(True)
-        self._task_filter.clear()
-        self._task_filter.addItem("All tasks", userData=None)
-
-        for tid, tname in sorted(self._tasks_by_id.items(), key=lambda kv: kv[0]):
-            label = tname or f"Task {tid}"
-            self._task_filter.addItem(label, userData=tid)
+    def _fetch_rows(self, project_id: int, with_tasks: bool = False):
+        """First batch of subtasks now (with tasks & counts in the same round-trip); any rest streams in."""
+        self._stop_stream()
+        if hasattr(self._repo, "list_tasks_and_subtasks_for_project"):
+            tasks, rows, counts = self._repo.list_tasks_and_subtasks_for_project(project_id)
+            self._tasks_list = tasks
+            self._tasks_by_id = dict(tasks)
+            self._subtask_counts_by_task = counts
+            self._set_rows(rows)
+            if sum(counts.values()) > len(rows) and hasattr(self._repo, "iter_subtasks_for_project"):
+                self._stream = self._repo.iter_subtasks_for_project(project_id, offset=len(rows))
+                self._stream_timer.start()
+        else:
+            if with_tasks:
+                self._refresh_task_names_cache(project_id)
+            self._set_rows(self._repo.list_subtasks_for_project(project_id))
+            self._subtask_counts_by_task = {tid: len(self._rows_by_task.get(tid, ())) for tid, _ in self._tasks_list}
+        if not with_tasks:
+            self._relabel_task_filter()   # same tasks; only the counts moved
+
+    def _stop_stream(self):
+        self._stream_timer.stop()
+        if self._stream is not None:
+            self._stream.close()   # releases the cursor
+            self._stream = None
+
+    def _pump_stream(self):
+        if self._stream is None:
+            return
+        batch = next(self._stream, None)
+        if not batch:
+            self._stream = None
+            return
+        self._all_rows.extend(batch)
+        for r in batch:
+            self._rows_by_task.setdefault(r.get("task_id"), []).append(r)
+        # Only the batch's rows under the current filter reach the table
+        tid = self._task_filter.currentData()
+        self._model.append_rows(batch if tid is None else [r for r in batch if r.get("task_id") == tid])
+        self._stream_timer.start()
 
-        if prev_tid is not None:
-            idx = self._task_filter.findData(prev_tid)
-            if idx >= 0:
-                self._task_filter.setCurrentIndex(idx)
+    def _set_rows(self, rows: List[dict]):
+        self._all_rows = rows
+        by_task: Dict[int, List[dict]] = {}
+        for r in rows:
+            by_task.setdefault(r.get("task_id"), []).append(r)
+        self._rows_by_task = by_task
 
-        self._task_filter.blockSignals(False)
+    def _populate_task_filter(self):
+        prev_tid = self._task_filter.currentData()
+        tasks = self._tasks_list   # already id-ordered
+
+        # QSignalBlocker restores signals even if population raises
+        with QSignalBlocker(self._task_filter):
+            self._task_filter.clear()
+            self._task_filter.addItems([self._all_tasks_label()] + [self._task_label(tid, tname) for tid, tname in tasks])
+            # UserRole is not displayed: skip the per-item dataChanged while tagging ids
+            with QSignalBlocker(self._task_filter.model()):
+                for i, (tid, _) in enumerate(tasks, start=1):
+                    self._task_filter.setItemData(i, tid)
+
+            if prev_tid is not None:
+                idx = self._task_filter.findData(prev_tid)
+                if idx >= 0:
+                    self._task_filter.setCurrentIndex(idx)
+
+    def _all_tasks_label(self) -> str:
+        return f"All tasks ({sum(self._subtask_counts_by_task.values())})"
+
+    def _task_label(self, tid: int, tname: Optional[str]) -> str:
+        return f"{tname or f'Task {tid}'} ({self._subtask_counts_by_task.get(tid, 0)})"
+
+    def _relabel_task_filter(self):
+        cmb = self._task_filter
+        cmb.setItemText(0, self._all_tasks_label())
+        for i in range(1, cmb.count()):
+            tid = cmb.itemData(i)
+            cmb.setItemText(i, self._task_label(tid, self._tasks_by_id.get(tid)))
 
     def _apply_filter(self):
         tid = self._task_filter.currentData()
-        rows = self._all_rows if tid is None else [r for r in self._all_rows if r.get("task_id") == tid]
+        rows = self._all_rows if tid is None else self._rows_by_task.get(tid, [])
         self._render(rows)
 
     @staticmethod
@@ -162,45 +420,38 @@ class SubtasksTab(QWidget):
         return SubtasksTab._PHASE_NAMES.get(int(phase_id), str(phase_id))
 
     def _render(self, rows: List[dict]):
-        self._table.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            sid = row.get("id") or row.get("subtask_id")
-            task_id = row.get("task_id")
-            tname = self._tasks_by_id.get(task_id, f"Task {task_id}")
-            name = row.get("name") or ""
-            phase_name = row.get("phase_name") or self._phase_label(row.get("phase_id"))
-            priority_id = row.get("priority_id")
-
-            id_item = QTableWidgetItem(str(sid) if sid is not None else "")
-            task_item = QTableWidgetItem(tname)
-            name_item = QTableWidgetItem(name)
-            phase_item = QTableWidgetItem(phase_name)
-            prio_item = QTableWidgetItem(self._priority_label(priority_id))
-
-            for it in (id_item, task_item, name_item, phase_item, prio_item):
-                it.setData(Qt.UserRole, sid)
-
-            self._table.setItem(r, 0, id_item)
-            self._table.setItem(r, 1, task_item)
-            self._table.setItem(r, 2, name_item)
-            self._table.setItem(r, 3, phase_item)
-            self._table.setItem(r, 4, prio_item)
-
-        self._table.resizeColumnsToContents()
+        tbl = self._table
+        prev_sid = self._selected_subtask_id()
+        # A model reset drops the selection; put it back on the same subtask
+        # (if still listed); our handler skips the intermediate states.
+        tbl.setUpdatesEnabled(False)
+        self._rendering = True
+        try:
+            self._model.set_rows(rows, self._tasks_by_id)
+            r = self._model.row_of(prev_sid) if prev_sid is not None else -1
+            if r >= 0:
+                tbl.selectRow(r)
+            else:
+                tbl.clearSelection()
+        finally:
+            self._rendering = False
+            tbl.setUpdatesEnabled(True)
         self._on_selection_changed()
 
     # ---------- selection & history ----------
     def _selected_subtask_id(self) -> Optional[int]:
-        items = self._table.selectedItems()
-        if not items:
+        rows = self._table.selectionModel().selectedRows()
+        if not rows:
             return None
-        sid = items[0].data(Qt.UserRole)
+        sid = rows[0].data(Qt.UserRole)
         try:
             return int(sid) if sid is not None else None
         except Exception:
             return None
 
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_):
+        if self._rendering:
+            return
         has_sel = self._selected_subtask_id() is not None
         self._btn_edit.setEnabled(has_sel)
         self._btn_delete.setEnabled(has_sel)
@@ -216,15 +467,48 @@ class SubtasksTab(QWidget):
             self._history.set_updates([])
             return
 
+        updates = self._timeline_cache.get(sid)
+        if updates is None:
+            updates = self._timeline_cache[sid] = self._fetch_timeline(sid)
+        self._history.set_updates(updates)
+        self._prefetch_neighbors(self._table.currentIndex().row())
+
+    def _invalidate_timelines(self, sid: Optional[int] = None):
+        if sid is None:
+            self._timeline_cache.clear()
+        else:
+            self._timeline_cache.pop(sid, None)
+        self._cache_gen += 1
+
+    def _prefetch_neighbors(self, row: int):
+        if row < 0 or not self._db_path:
+            return   # no database file for a worker connection: timelines load on selection only
+        pool = QThreadPool.globalInstance()
+        for r in range(row - _PREFETCH_BEHIND, row + _PREFETCH_AHEAD + 1):
+            if len(self._prefetching) >= _PREFETCH_MAX_IN_FLIGHT:
+                return
+            sid = self._model.sid_at(r)
+            if sid is None or sid in self._timeline_cache or sid in self._prefetching:
+                continue
+            self._prefetching.add(sid)
+            job = _TimelinePrefetchJob(self, self._cache_gen, sid)
+            job.signals.fetched.connect(self._on_prefetched)
+            pool.start(job)
+
+    def _on_prefetched(self, generation: int, sid: int, updates):
+        self._prefetching.discard(sid)
+        if generation == self._cache_gen and updates is not None:
+            self._timeline_cache.setdefault(sid, updates)
+
+    def _fetch_timeline(self, sid: int) -> List[HistoryUpdate]:
         repo = self._get_updates_repo()
-        updates = repo.list_updates_for_subtask(sid, order_desc=True)
+        return self._build_timeline(repo.list_updates_for_subtask(sid, order_desc=True))
 
+    def _build_timeline(self, updates: List[Dict[str, Any]]) -> List[HistoryUpdate]:
         # Coalesce near-simultaneous updates (<= 2 seconds) and drop non-changes
         updates = self._coalesce_updates(updates, window_secs=2)
         updates = self._normalize_changes(updates)
-        updates = self._decorate_updates(updates)
-
-        self._history.set_updates(updates)
+        return self._decorate_updates(updates)
 
     def _get_updates_repo(self) -> SQLiteSubtaskUpdatesRepository:
         if self._updates_repo is None:
@@ -335,8 +619,8 @@ class SubtasksTab(QWidget):
             out.append(w)
         return out
 
-    def _decorate_updates(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
+    def _decorate_updates(self, updates: List[Dict[str, Any]]) -> List[HistoryUpdate]:
+        out: List[HistoryUpdate] = []
         for u in updates:
             u = dict(u)
             # Add *_name lookups when IDs exist
@@ -349,21 +633,19 @@ class SubtasksTab(QWidget):
             if u.get("new_priority_id") is not None:
                 u["new_priority_name"] = self._PRIORITY_NAMES.get(int(u["new_priority_id"]), str(u["new_priority_id"]))
             u["updated_local"] = u.get("updated_at_utc")
-            out.append(u)
+            out.append(HistoryUpdate.from_dict(u))
         return out
 
     # ---------- repo helpers ----------
     def _refresh_task_names_cache(self, project_id: int):
-        # Use the subtask repo's API to get a mapping of tasks for this project, including tasks without subtasks.
+        # Use the subtask repo's API to get the tasks for this project, including tasks without subtasks.
         try:
-            self._tasks_by_id = self._repo.list_tasks_for_project(project_id)  # {id: name}
+            self._tasks_list = list(self._repo.list_tasks_for_project(project_id))  # [(id, name)] by id
         except Exception:
-            self._tasks_by_id = {}
             # Fallback: scan rows for tasks present
-            for r in self._all_rows:
-                tid = r.get("task_id")
-                if tid is not None and tid not in self._tasks_by_id:
-                    self._tasks_by_id[tid] = f"Task {tid}"
+            seen = {r.get("task_id") for r in self._all_rows} - {None}
+            self._tasks_list = [(tid, f"Task {tid}") for tid in sorted(seen)]
+        self._tasks_by_id = dict(self._tasks_list)
 
     # ---------- CRUD ----------
     def _on_new(self):
@@ -399,7 +681,7 @@ class SubtasksTab(QWidget):
             note_on_create=note or "Created via UI",
         )
         # reload current filter
-        self._all_rows = self._repo.list_subtasks_for_project(self._project_id)
+        self._fetch_rows(self._project_id)
         self._apply_filter()
 
     def _on_edit(self):
@@ -407,7 +689,14 @@ class SubtasksTab(QWidget):
         if sid is None:
             return
 
-        rec = self._repo.get_subtask(sid)
+        if hasattr(self._repo, "get_subtask_with_history"):
+            # Record and timeline in one round trip; the panel behind the dialog shows it fresh
+            rec, raw = self._repo.get_subtask_with_history(sid)
+            if rec:
+                updates = self._timeline_cache[sid] = self._build_timeline(raw)
+                self._history.set_updates(updates)
+        else:
+            rec = self._repo.get_subtask(sid)
         if not rec:
             QMessageBox.warning(self, "Not found", f"Could not load subtask #{sid}.")
             return
@@ -429,24 +718,27 @@ class SubtasksTab(QWidget):
             QMessageBox.warning(self, "Missing name", "Please provide a subtask name.")
             return
 
-        # Apply only what changed
-        changed = False
-        if int(phase_id) != int(rec.get("phase_id", 1)):
-            self._repo.change_subtask_phase(sid, int(phase_id), reason="phase_change", note=note or None)
-            changed = True
-        if int(priority_id) != int(rec.get("priority_id", 2)):
-            self._repo.set_subtask_priority(sid, int(priority_id), note=note or None)
-            changed = True
-        if note and not changed:
-            # record a note without other changes
-            try:
-                self._repo.update_subtask_fields(sid, note=note)
-            except Exception:
-                pass
+        # Writes run on the pool over the job's own connection; the table stays live,
+        # but no second edit/delete until they land
+        for b in (self._btn_new, self._btn_edit, self._btn_delete):
+            b.setEnabled(False)
+        job = _SubtaskSaveJob(self._repo, sid, rec, phase_id, priority_id, note, self._db_path)
+        job.signals.saved.connect(self._on_saved)
+        if job.db_path:
+            QThreadPool.globalInstance().start(job)
+        else:
+            job.run()   # in-memory database: only the shared connection can see it
+
+    def _on_saved(self, sid: int, error: str):
+        self._btn_new.setEnabled(True)
+        if error:
+            QMessageBox.warning(self, "Save failed", f"Could not update subtask #{sid}:\n{error}")
 
         # Reload rows and refresh timeline for selected subtask
-        self._all_rows = self._repo.list_subtasks_for_project(self._project_id)
-        self._apply_filter()
+        self._invalidate_timelines(sid)
+        if self._project_id is not None:
+            self._fetch_rows(self._project_id)
+        self._apply_filter()     # re-enables Edit/Delete for the selection
         self._load_timeline_for_selected()
 
     def _on_delete(self):
@@ -456,6 +748,7 @@ class SubtasksTab(QWidget):
         if QMessageBox.question(self, "Delete Subtask", f"Are you sure you want to delete subtask #{sid}?",
                                 QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
             self._repo.delete_subtask(sid)
-            self._all_rows = self._repo.list_subtasks_for_project(self._project_id)
+            self._invalidate_timelines(sid)
+            self._fetch_rows(self._project_id)
             self._apply_filter()
             self._history.set_updates([])
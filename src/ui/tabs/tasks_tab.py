@@ -1,8 +1,12 @@
 # Rev 0.6.8
 # trackerZ – TasksTab (Rev 0.6.8)
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
+from repositories.db import database_path
+from ui.phase_items import phase_items
 from ui.tasks_view import TasksView
 
+
 class TasksTab(QWidget):
     def __init__(self, tasks_repo, phases_repo, parent=None):
         super().__init__(parent)
@@ -11,11 +15,15 @@ class TasksTab(QWidget):
         self._project_id = None
 
         self._filter = QComboBox()
-        self._filter.addItem("All phases", userData=None)
-        for p in self._phases.list_phases():
-            self._filter.addItem(p["name"], userData=p["id"])
+        self._fill_phase_filter()
 
         self._view = TasksView(tasks_repo)
+
+        # Debounce filter changes: arrowing through the combo only queries for the final pick
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._reload)
         self._filter.currentIndexChanged.connect(self._on_phase_changed)
 
         top = QHBoxLayout()
@@ -32,10 +40,16 @@ class TasksTab(QWidget):
         if phase_id is not None:
             idx = max(0, self._filter.findData(phase_id))
             self._filter.setCurrentIndex(idx)
+        self._filter_timer.stop()
         self._reload()
 
+    def _fill_phase_filter(self):
+        self._filter.addItem("All phases", userData=None)
+        for name, pid in phase_items(self._phases, database_path(self._phases)):
+            self._filter.addItem(name, userData=pid)
+
     def _on_phase_changed(self, _=None):
-        self._reload()
+        self._filter_timer.start()
 
     def _reload(self):
         phase_id = self._filter.currentData()
@@ -1,16 +1,90 @@
 # src/ui/tasks_view.py
 # Rev 0.6.8 — M6.5 bottom-center History panel (schema Rev 1.1.0)
 from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal, QSettings, QModelIndex
+from PySide6.QtCore import Qt, Signal, QSettings, QModelIndex, QAbstractTableModel
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTableWidget, QTableWidgetItem, QHeaderView,
+    QWidget, QVBoxLayout, QTableView, QAbstractItemView, QHeaderView,
     QHBoxLayout, QPushButton, QMessageBox, QDialog, QSplitter
 )
 
 from viewmodels.tasks_viewmodel import TasksViewModel
 from ui.task_editor_dialog import TaskEditorDialog
 from ui.panels.history_panel import HistoryPanel
+from models.entities import HistoryUpdate
+
+
+class _TasksModel(QAbstractTableModel):
+    """Cell text is formatted once per reload in set_rows(); data() is a tuple lookup."""
+
+    _HEADERS = ("ID", "Name", "Phase", "Priority")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids: List[Optional[int]] = []
+        self._cells: List[Tuple[str, str, str, str]] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]]) -> None:
+        # Phase/priority repeat across rows: keep one string object per distinct label
+        labels: Dict[str, str] = {}
+        intern = labels.setdefault
+        phase_label, priority_label = TasksView._phase_label, TasksView._priority_label
+
+        ids = [_task_id(row) for row in rows]
+        id_col = ["" if tid is None else str(tid) for tid in ids]
+        name_col = [row.get("name") or row.get("title") or "" for row in rows]
+        phase_col = [intern(p, p) for p in (row.get("phase_name") or phase_label(row.get("phase_id")) for row in rows)]
+        prio_col = [intern(p, p) for p in (priority_label(row.get("priority_id")) for row in rows)]
+        cells: List[Tuple[str, str, str, str]] = list(zip(id_col, name_col, phase_col, prio_col))
+
+        # Recycle existing rows instead of resetting the model (same scheme as the history list)
+        n_old, n_new = len(self._cells), len(cells)
+        common = min(n_old, n_new)
+        if n_new < n_old:
+            self.beginRemoveRows(QModelIndex(), n_new, n_old - 1)
+            del self._ids[n_new:], self._cells[n_new:]
+            self.endRemoveRows()
+        changed = [r for r in range(common) if self._cells[r] != cells[r] or self._ids[r] != ids[r]]
+        if changed:
+            self._ids[:common], self._cells[:common] = ids[:common], cells[:common]
+            self.dataChanged.emit(self.index(changed[0], 0), self.index(changed[-1], len(self._HEADERS) - 1))
+        if n_new > n_old:
+            self.beginInsertRows(QModelIndex(), n_old, n_new - 1)
+            self._ids.extend(ids[n_old:])
+            self._cells.extend(cells[n_old:])
+            self.endInsertRows()
+
+    def row_of(self, task_id: int) -> int:
+        try:
+            return self._ids.index(task_id)
+        except ValueError:
+            return -1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cells)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._cells[index.row()][index.column()]
+        if role == Qt.UserRole:
+            return self._ids[index.row()]
+        return None
+
+
+def _task_id(row: Dict[str, Any]):
+    tid = row.get("id") or row.get("task_id")
+    return int(tid) if tid is not None else None
 
 
 class TasksView(QWidget):
@@ -35,13 +109,15 @@ class TasksView(QWidget):
         self._btn_history.setEnabled(False)
 
         # ---------- Table: ID | Name | Phase | Priority ----------
-        self._table = QTableWidget(0, 4)
-        self._table.setHorizontalHeaderLabels(["ID", "Name", "Phase", "Priority"])
-        self._table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self._table.setSelectionBehavior(QTableWidget.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SingleSelection)
-        self._table.itemDoubleClicked.connect(self._on_item_double_clicked)
-        self._table.itemSelectionChanged.connect(self._on_selection_changed)
+        self._model = _TasksModel(self)
+        self._rendering = False   # _render() restoring the selection; handler runs once at the end
+        self._table = QTableView()
+        self._table.setModel(self._model)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self._table.doubleClicked.connect(self._on_item_double_clicked)
+        self._table.selectionModel().selectionChanged.connect(self._on_selection_changed)
 
         hdr = self._table.horizontalHeader()
         hdr.setStretchLastSection(False)
@@ -52,14 +128,16 @@ class TasksView(QWidget):
 
         vh = self._table.verticalHeader()
         vh.setVisible(False)
+        vh.setSectionResizeMode(QHeaderView.Fixed)  # fixed row height: no per-row height probing
         vh.setDefaultSectionSize(22)
         vh.setMinimumSectionSize(18)
+        self._table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         self._table.setWordWrap(False)
         self._table.setAlternatingRowColors(True)
-        self._table.setSizeAdjustPolicy(QTableWidget.AdjustToContentsOnFirstShow)
+        self._table.setSizeAdjustPolicy(QAbstractItemView.AdjustToContentsOnFirstShow)
 
         # ---------- History panel (bottom-center) ----------
-        # Expect HistoryPanel to expose: set_updates(list[dict])
+        # Expect HistoryPanel to expose: set_updates(list[HistoryUpdate])
         self._history = HistoryPanel(self)
         self._history.setObjectName("HistoryPanel")
 
@@ -145,60 +223,51 @@ class TasksView(QWidget):
             return "—"
         return TasksView._PHASE_NAMES.get(int(phase_id), str(phase_id))
 
+    # Stable mapping: 1 Low, 2 Medium, 3 High, 4 Critical
+    _PRIORITY_NAMES = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
+
     @staticmethod
     def _priority_label(priority_id: int | None) -> str:
-        # Stable mapping: 1 Low, 2 Medium, 3 High, 4 Critical
-        names = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
-        return names.get(priority_id, "—")
+        return TasksView._PRIORITY_NAMES.get(priority_id, "—")
 
     def _render(self, rows: list[dict]):
-        self._table.setRowCount(len(rows))
-        for r, row in enumerate(rows):
-            tid = row.get("id") or row.get("task_id")
-            name = row.get("name") or row.get("title") or ""
-            phase_name = row.get("phase_name") or self._phase_label(row.get("phase_id"))
-            priority_id = row.get("priority_id")
-
-            id_item = QTableWidgetItem(str(tid) if tid is not None else "")
-            name_item = QTableWidgetItem(name)
-            phase_item = QTableWidgetItem(phase_name)
-            prio_item = QTableWidgetItem(self._priority_label(priority_id))
-
-            for it in (id_item, name_item, phase_item, prio_item):
-                it.setData(Qt.UserRole, tid)
-
-            self._table.setItem(r, 0, id_item)
-            self._table.setItem(r, 1, name_item)
-            self._table.setItem(r, 2, phase_item)
-            self._table.setItem(r, 3, prio_item)
-
-        self._table.resizeColumnsToContents()
+        tbl = self._table
+        prev_tid = self._selected_task_id()
+        # Rows are rewritten in place, so the selection stays on the same row
+        # index; move it to wherever the selected task ended up (or drop it).
+        # The view still repaints the highlight; only our handler skips the intermediate states.
+        self._rendering = True
+        try:
+            self._model.set_rows(rows)
+            r = self._model.row_of(prev_tid) if prev_tid is not None else -1
+            if r >= 0:
+                tbl.selectRow(r)
+            else:
+                tbl.clearSelection()
+            # Column widths come from the header resize modes set in __init__;
+            # no per-reload resizeColumnsToContents() pass.
+        finally:
+            self._rendering = False
         self._on_selection_changed()
 
-    def _on_item_double_clicked(self, item: QTableWidgetItem):
-        if not item:
+    def _on_item_double_clicked(self, index: QModelIndex):
+        if not index.isValid():
             return
-        tid = item.data(Qt.UserRole)
+        tid = index.data(Qt.UserRole)
         if tid is None:
-            try:
-                tid = int(self._table.item(item.row(), 0).text())
-            except Exception:
-                return
+            return
         self.taskChosen.emit(int(tid))
 
     def _selected_task_id(self) -> int | None:
-        items = self._table.selectedItems()
-        if not items:
+        rows = self._table.selectionModel().selectedRows()
+        if not rows:
             return None
-        tid = items[0].data(Qt.UserRole)
-        if tid is None:
-            try:
-                tid = int(self._table.item(items[0].row(), 0).text())
-            except Exception:
-                return None
-        return int(tid)
+        tid = rows[0].data(Qt.UserRole)
+        return int(tid) if tid is not None else None
 
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_):
+        if self._rendering:
+            return
         has_sel = self._selected_task_id() is not None
         self._btn_edit.setEnabled(has_sel)
         self._btn_delete.setEnabled(has_sel)
@@ -231,6 +300,10 @@ class TasksView(QWidget):
             note_on_create=note or "Created via UI",
         )
 
+    def _cell_text(self, row: int, col: int, default: str) -> str:
+        """Displayed text of a table cell; `default` when no row is current."""
+        return self._model.index(row, col).data() if row >= 0 else default
+
     def _on_edit_clicked(self):
         tid = self._selected_task_id()
         if tid is None:
@@ -240,10 +313,10 @@ class TasksView(QWidget):
         rec = self._vm.get_task_details(tid) if hasattr(self._vm, "get_task_details") else None
         if not rec:
             # fallback to current table values if repo call not yet added
-            row = self._table.currentRow()
-            cur_name = self._table.item(row, 1).text() if row >= 0 else ""
-            phase_label = self._table.item(row, 2).text() if row >= 0 else "Open"
-            prio_label = self._table.item(row, 3).text() if row >= 0 else "Medium"
+            row = self._table.currentIndex().row()
+            cur_name = self._cell_text(row, 1, "")
+            phase_label = self._cell_text(row, 2, "Open")
+            prio_label = self._cell_text(row, 3, "Medium")
             phase_id_map = {1: "Open", 2: "In Progress", 3: "In Hiatus", 4: "Resolved", 5: "Closed"}
             prio_id_map = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
             phase_name_to_id = {v: k for k, v in phase_id_map.items()}
@@ -347,6 +420,6 @@ class TasksView(QWidget):
         # Kept for compatibility if other code triggers it; delegate to reload
         self._maybe_reload_history()
 
-    def _on_timeline_loaded(self, task_id: int, updates: list[dict]):
+    def _on_timeline_loaded(self, task_id: int, updates: list[HistoryUpdate]):
         # Render into the bottom-center history panel
         self._history.set_updates(updates)
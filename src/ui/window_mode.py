@@ -18,8 +18,7 @@ def lock_maximized(win, *, lock_resize: bool = False):
 
     if lock_resize:
         # Fix size to the available area so the user can't resize after maximize
-        win.setMinimumSize(rect.size())
-        win.setMaximumSize(rect.size())
+        lock_to_screen(win, rect)
     else:
         # Allow resizing after maximize
         win.setMinimumSize(0, 0)
@@ -28,6 +27,18 @@ def lock_maximized(win, *, lock_resize: bool = False):
     win.showMaximized()
 
 
+def lock_to_screen(win, rect: QRect | None = None):
+    """
+    Fix the window's size to the available area of its screen (taskbar-safe).
+    Safe on a visible window: no window flags are touched.
+    """
+    if rect is None:
+        screen = QGuiApplication.screenAt(win.frameGeometry().center()) or QGuiApplication.primaryScreen()
+        rect = screen.availableGeometry()
+    win.setMinimumSize(rect.size())
+    win.setMaximumSize(rect.size())
+
+
 def lock_dialog_fixed(win, *, width_ratio=0.6, height_ratio=0.7):
     """
     For modal dialogs: keep them *not* maximized, but non-resizable and sized
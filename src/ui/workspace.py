@@ -17,9 +17,12 @@ class WorkspaceStack(QWidget):
         lay = QVBoxLayout(self)
         lay.setContentsMargins(0, 0, 0, 0)
         lay.addWidget(self._stack)
+        self._stack.currentChanged.connect(self._on_current_changed)
         
     def add_panel(self, key: str, panel: QWidget) -> None:
         self._keys[key] = self._stack.addWidget(panel)
+        # Hidden panels don't take part in update/paint work until they are shown
+        panel.setUpdatesEnabled(panel is self._stack.currentWidget())
         
     def show_panel(self, key: str) -> None:
         idx = self._keys.get(key, -1)
@@ -32,3 +35,7 @@ class WorkspaceStack(QWidget):
             if i == idx:
                 return k
         return None
+
+    def _on_current_changed(self, idx: int) -> None:
+        for i in range(self._stack.count()):
+            self._stack.widget(i).setUpdatesEnabled(i == idx)
@@ -1,54 +1,173 @@
 # Rev 0.6.8 — include phase_id, priority_id in emitted info
 from __future__ import annotations
+import logging
+from collections import OrderedDict
+from contextlib import closing
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QRunnable, QThreadPool
+
+from repositories.db import connect, database_path
+
+log = logging.getLogger(__name__)
+
+@dataclass(slots=True, frozen=True)
+class ProjectInfo:
+    """Project header + counts as published by ProjectOverviewViewModel.loaded."""
+    id: int
+    name: str
+    description: Optional[str]
+    tasks_total: int
+    subtasks_total: int
+    phase_id: int = 1
+    priority_id: int = 2
+    # only with get_project_overview():
+    created_at_utc: Optional[str] = None
+    updated_at_utc: Optional[str] = None
+    tasks_by_phase: Dict[int, int] = field(default_factory=dict)
+
+
+_HEADER_CACHE_MAX = 32      # headers kept per view model (least recently used dropped first)
+
+
+class _LoadSignals(QObject):
+    done = Signal(int, object, str)     # project_id, ProjectInfo (None if not found), error ("" on success)
+
+
+class _LoadJob(QRunnable):
+    """
+    Runs ProjectOverviewViewModel._query_repos off the GUI thread, through the VM's
+    repositories rebuilt over a read-only connection of its own (db_path).
+    """
+
+    def __init__(self, vm: "ProjectOverviewViewModel", project_id: int) -> None:
+        super().__init__()
+        self._repos = (vm._projects, vm._tasks, vm._subs)
+        self.db_path = vm._db_path
+        self._project_id = project_id
+        self.signals = _LoadSignals()
+
+    def run(self) -> None:
+        info, error = None, ""
+        try:
+            with closing(connect(self.db_path, readonly=True)) as con:
+                repos = [type(r)(con) if r is not None else None for r in self._repos]
+                info = ProjectOverviewViewModel._query_repos(*repos, self._project_id)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self.signals.done.emit(self._project_id, info, error)
+
 
 class ProjectOverviewViewModel(QObject):
     """
     Emits:
-      loaded({
-        "id": int,
-        "name": str,
-        "description": str|None,
-        "tasks_total": int,
-        "subtasks_total": int,
-        "phase_id": int,        # NEW
-        "priority_id": int,     # NEW
-      })
+      loaded(ProjectInfo | None)    # None: project not found
+      failed(int, str)              # project_id, error; last() and the cache keep the previous header
     """
-    loaded = Signal(dict)
+    loaded = Signal(object)
+    failed = Signal(int, str)
 
     def __init__(self, projects_repo, tasks_repo, subtasks_repo):
         super().__init__()
         self._projects = projects_repo
         self._tasks = tasks_repo
         self._subs = subtasks_repo
-        self._last: Optional[Dict[str, Any]] = None
+        # load_async() jobs open their own connection on this file ("" = in-memory: loads synchronously)
+        self._db_path = database_path(projects_repo)
+        self._last: Optional[ProjectInfo] = None
+        self._pending: Optional[int] = None     # project id of the newest load_async()
+        # project_id -> last ProjectInfo published here (shown before a refresh lands)
+        self._header_cache: "OrderedDict[int, ProjectInfo]" = OrderedDict()
 
     def load(self, project_id: int) -> None:
-        proj = self._projects.get_project(project_id)
-        if not proj:
-            self._last = None
-            self.loaded.emit({})
+        self._pending = None
+        self._publish(project_id, self._query(project_id))
+
+    def load_async(self, project_id: int) -> None:
+        """Same as load(), but the queries run on the global thread pool.
+        Only the newest request is published; earlier results are dropped."""
+        if not self._db_path:
+            self.load(project_id)   # in-memory database: only the shared connection can see it
             return
+        self._pending = project_id
+        job = _LoadJob(self, project_id)
+        job.signals.done.connect(self._on_done)
+        QThreadPool.globalInstance().start(job)
+
+    def last(self) -> Optional[ProjectInfo]:
+        return self._last
 
-        tasks_total = self._tasks.count_tasks_total(project_id=project_id)
-        if hasattr(self._subs, "count_subtasks_total_by_project"):
-            subtasks_total = self._subs.count_subtasks_total_by_project(project_id=project_id)
+    def cached(self, project_id: int) -> Optional[ProjectInfo]:
+        """Header last loaded for project_id by this view model, or None. May be stale."""
+        info = self._header_cache.get(project_id)
+        if info is not None:
+            self._header_cache.move_to_end(project_id)
+        return info
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        """Forget the cached header for project_id (all of them if None); call after writing a project."""
+        if project_id is None:
+            self._header_cache.clear()
         else:
-            subtasks_total = 0
-
-        info = {
-            "id": int(proj.get("id")),
-            "name": proj.get("name") or "",
-            "description": proj.get("description"),
-            "tasks_total": int(tasks_total),
-            "subtasks_total": int(subtasks_total),
-            "phase_id": int(proj.get("phase_id", 1)),
-            "priority_id": int(proj.get("priority_id", 2)),
-        }
+            self._header_cache.pop(project_id, None)
+
+    # ---- Internals
+    def _on_done(self, project_id: int, info: Optional[ProjectInfo], error: str) -> None:
+        if project_id != self._pending:
+            return  # superseded by a newer load/load_async
+        self._pending = None
+        if error:
+            log.warning("Project %s overview load failed: %s", project_id, error)
+            self.failed.emit(project_id, error)
+            return
+        self._publish(project_id, info)
+
+    def _publish(self, project_id: int, info: Optional[ProjectInfo]) -> None:
         self._last = info
+        if info is None:
+            self._header_cache.pop(project_id, None)
+        else:
+            self._header_cache[project_id] = info
+            self._header_cache.move_to_end(project_id)
+            if len(self._header_cache) > _HEADER_CACHE_MAX:
+                self._header_cache.popitem(last=False)
         self.loaded.emit(info)
 
-    def last(self) -> Optional[Dict[str, Any]]:
-        return self._last
+    def _query(self, project_id: int) -> Optional[ProjectInfo]:
+        return self._query_repos(self._projects, self._tasks, self._subs, project_id)
+
+    @staticmethod
+    def _query_repos(projects, tasks, subs, project_id: int) -> Optional[ProjectInfo]:
+        extra: Dict[str, Any] = {}
+        if hasattr(projects, "get_project_overview"):
+            proj = projects.get_project_overview(project_id)
+            if not proj:
+                return None
+            tasks_total = proj.get("tasks_total") or 0
+            subtasks_total = proj.get("subtasks_total") or 0
+            extra = {
+                "created_at_utc": proj.get("created_at_utc"),
+                "updated_at_utc": proj.get("updated_at_utc"),
+                "tasks_by_phase": {ph: int(proj.get(f"tasks_phase_{ph}") or 0) for ph in range(1, 6)},
+            }
+        else:
+            proj = projects.get_project(project_id)
+            if not proj:
+                return None
+
+            tasks_total = tasks.count_tasks_total(project_id=project_id)
+            if hasattr(subs, "count_subtasks_total_by_project"):
+                subtasks_total = subs.count_subtasks_total_by_project(project_id=project_id)
+            else:
+                subtasks_total = 0
+
+        return ProjectInfo(
+            id=int(proj.get("id")),
+            name=proj.get("name") or "",
+            description=proj.get("description"),
+            tasks_total=int(tasks_total),
+            subtasks_total=int(subtasks_total),
+            phase_id=int(proj.get("phase_id", 1)),
+            priority_id=int(proj.get("priority_id", 2)),
+            **extra,
+        )
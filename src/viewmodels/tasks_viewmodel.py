@@ -4,10 +4,11 @@ from __future__ import annotations
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, QTimer
 
 from repositories.sqlite_task_updates_repository import SQLiteTaskUpdatesRepository
 from repositories.sqlite_phase_repository import SQLitePhaseRepository
+from models.entities import HistoryUpdate
 
 
 class TasksViewModel(QObject):
@@ -27,12 +28,16 @@ class TasksViewModel(QObject):
 
         self._priority_names: Dict[int, str] = {1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
 
+        # Set by commands; the queued reload runs once however many commands ran
+        self._reload_pending = False
+
     # ---- filters
     def set_filters(self, project_id: int, phase_id: Optional[int] = None, search: Optional[str] = None) -> None:
         self._project_id, self._phase_id, self._search = project_id, phase_id, search
 
     # ---- queries
     def reload(self) -> None:
+        self._reload_pending = False
         if self._project_id is None:
             self.tasksReloaded.emit(0, [])
             return
@@ -40,42 +45,55 @@ class TasksViewModel(QObject):
         rows = self._tasks.list_tasks_filtered(project_id=self._project_id, phase_id=self._phase_id, search=self._search, limit=500, offset=0)
         self.tasksReloaded.emit(total, rows)
 
+    def _schedule_reload(self) -> None:
+        # e.g. an edit dialog applying phase + priority + note -> one reload, not three
+        if self._reload_pending:
+            return
+        self._reload_pending = True
+        QTimer.singleShot(0, self._flush_reload)
+
+    def _flush_reload(self) -> None:
+        if not self._reload_pending:
+            return
+        self._reload_pending = False
+        self.reload()
+
     # ---- commands
     def create_task(self, *, project_id: int, name: str, description: str | None, phase_id: int = 1, note_on_create: str | None = None, priority_id: int | None = None) -> int | None:
         try:
             tid = self._tasks.create_task(project_id=project_id, name=name, description=description or "", phase_id=phase_id, priority_id=(priority_id if priority_id is not None else 2), note_on_create=note_on_create)
-            self.reload()
+            self._schedule_reload()
             return tid
         except Exception:
-            self.reload()
+            self._schedule_reload()
             return None
 
     def update_task_fields(self, *, task_id: int, name: Optional[str] = None, description: Optional[str] = None, note: Optional[str] = None) -> bool:
         ok = self._tasks.update_task_fields(task_id, name=name, description=description, note=note)
-        if ok: self.reload()
+        if ok: self._schedule_reload()
         return ok
 
     def delete_task(self, task_id: int) -> bool:
         ok = self._tasks.delete_task(task_id)
-        if ok: self.reload()
+        if ok: self._schedule_reload()
         return ok
 
     def change_task_phase(self, *, task_id: int, new_phase_id: int, reason: Optional[str] = None, note: Optional[str] = None) -> bool:
         try:
             ok = self._tasks.change_task_phase(task_id, new_phase_id, reason=reason or "phase_change", note=note)
-            if ok: self.reload()
+            if ok: self._schedule_reload()
             return ok
         except Exception:
-            self.reload()
+            self._schedule_reload()
             return False
 
     def set_task_priority(self, *, task_id: int, new_priority_id: int, note: str | None = None) -> bool:
         try:
             ok = self._tasks.set_task_priority(task_id, new_priority_id, note=note)
-            if ok: self.reload()
+            if ok: self._schedule_reload()
             return bool(ok)
         except Exception:
-            self.reload()
+            self._schedule_reload()
             return False
 
     # ---- timeline
@@ -256,8 +274,8 @@ class TasksViewModel(QObject):
         
 
     # ---------- decoration ----------
-    def _decorate_updates(self, updates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
+    def _decorate_updates(self, updates: List[Dict[str, Any]]) -> List[HistoryUpdate]:
+        out: List[HistoryUpdate] = []
         for u in updates:
             u = dict(u)
             # only decorate when IDs present (means a real change)
@@ -270,5 +288,5 @@ class TasksViewModel(QObject):
             if u.get("new_priority_id") is not None:
                 u["new_priority_name"] = self._priority_name(u.get("new_priority_id"))
             u["updated_local"] = u.get("updated_at_utc")
-            out.append(u)
+            out.append(HistoryUpdate.from_dict(u))
         return out
@@ -2,11 +2,17 @@
 
 """Pytest fixtures for trackerZ (Rev 0.6.8)"""
 from __future__ import annotations
+import os
 import sqlite3
+import sys
 import pytest
 from pathlib import Path
 from src.repositories.db import Database
 
+# UI modules import their siblings top-level (ui, repositories, models), as when run from src/
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 
 
 
@@ -19,3 +25,9 @@ def db_conn(tmp_path: Path):
         yield db.conn
     finally:
         db.close()
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
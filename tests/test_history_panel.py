@@ -0,0 +1,59 @@
+from __future__ import annotations
+import pytest
+
+from ui.panels.history_panel import _HistoryModel
+
+
+def row(ts: str, note: str = "") -> tuple:
+    return (ts, "note", "Note", (), note)
+
+
+@pytest.fixture()
+def model(qapp):
+    m = _HistoryModel()
+    log = []
+    m.rowsInserted.connect(lambda _p, a, b: log.append(("insert", a, b)))
+    m.rowsRemoved.connect(lambda _p, a, b: log.append(("remove", a, b)))
+    m.dataChanged.connect(lambda a, b, *_: log.append(("changed", a.row(), b.row())))
+    m.modelReset.connect(lambda: log.append(("reset",)))
+    return m, log
+
+
+def test_set_rows_appends_only_the_tail(model):
+    m, log = model
+    assert m.set_rows([row("a"), row("b")]) is False
+    log.clear()
+
+    assert m.set_rows([row("a"), row("b"), row("c")]) is False
+    assert log == [("insert", 2, 2)]
+    assert m.rowCount() == 3
+
+
+def test_set_rows_rewrites_changed_rows_in_place(model):
+    m, log = model
+    m.set_rows([row("a"), row("b"), row("c")])
+    log.clear()
+
+    assert m.set_rows([row("a"), row("b", "edited"), row("c")]) is True
+    assert log == [("changed", 1, 1)]
+    assert "edited" in m.data(m.index(1))
+
+
+def test_set_rows_removes_only_the_tail(model):
+    m, log = model
+    m.set_rows([row("a"), row("b"), row("c")])
+    log.clear()
+
+    assert m.set_rows([row("a")]) is False
+    assert log == [("remove", 1, 2)]
+    assert m.rowCount() == 1
+
+
+def test_set_rows_unchanged_emits_nothing(model):
+    m, log = model
+    rows = [row("a"), row("b")]
+    m.set_rows(rows)
+    log.clear()
+
+    assert m.set_rows(list(rows)) is False
+    assert log == []
@@ -0,0 +1,65 @@
+from __future__ import annotations
+import pytest
+
+from repositories.sqlite_project_repository import SQLiteProjectRepository
+from repositories.sqlite_subtask_repository import SQLiteSubtaskRepository
+from repositories.sqlite_task_repository import SQLiteTaskRepository
+from ui.tabs.overview_tab import OverviewTab
+
+
+def seed_project(conn, name: str = "Demo") -> int:
+    cur = conn.execute("INSERT INTO projects(name) VALUES(?)", (name,))
+    return int(cur.lastrowid)
+
+
+def seed_task(conn, project_id: int, phase_id: int = 1) -> int:
+    cur = conn.execute(
+        "INSERT INTO tasks(project_id, name, phase_id) VALUES(?,?,?)",
+        (project_id, "T", phase_id),
+    )
+    return int(cur.lastrowid)
+
+
+def seed_subtask(conn, task_id: int) -> int:
+    cur = conn.execute("INSERT INTO subtasks(task_id, name) VALUES(?,?)", (task_id, "S"))
+    return int(cur.lastrowid)
+
+
+@pytest.fixture()
+def tab(qapp, db_conn):
+    t = OverviewTab(SQLiteProjectRepository(db_conn), SQLiteTaskRepository(db_conn),
+                    SQLiteSubtaskRepository(db_conn))
+    yield t
+    t.deleteLater()
+
+
+def test_aggregates_sql_returns_phase_counts_and_subtask_total(db_conn):
+    pid = seed_project(db_conn)
+    t_open = seed_task(db_conn, pid, phase_id=1)
+    seed_task(db_conn, pid, phase_id=2)
+    seed_task(db_conn, pid, phase_id=2)
+    seed_subtask(db_conn, t_open)
+    seed_subtask(db_conn, t_open)
+    seed_subtask(db_conn, seed_task(db_conn, seed_project(db_conn, "Other")))
+
+    rows = sorted(db_conn.execute(OverviewTab._AGGREGATES_SQL, (pid, pid)), key=lambda r: (r[0], r[1] or 0))
+    assert rows == [("phase", 1, 1), ("phase", 2, 2), ("subs", None, 2)]
+
+
+def test_aggregates_sql_empty_project_still_reports_subtasks(db_conn):
+    pid = seed_project(db_conn)
+    assert list(db_conn.execute(OverviewTab._AGGREGATES_SQL, (pid, pid))) == [("subs", None, 0)]
+
+
+def test_load_fills_the_count_labels(tab, db_conn):
+    pid = seed_project(db_conn)
+    t_open = seed_task(db_conn, pid, phase_id=1)
+    seed_task(db_conn, pid, phase_id=2)
+    seed_subtask(db_conn, t_open)
+
+    tab.load(pid)
+    assert tab._lbl_tasks_total.text() == "2"
+    assert tab._lbl_tasks_open.text() == "1"
+    assert tab._lbl_tasks_inprog.text() == "1"
+    assert tab._lbl_tasks_closed.text() == "0"
+    assert tab._lbl_subtasks_total.text() == "1"
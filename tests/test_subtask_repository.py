@@ -0,0 +1,177 @@
+from __future__ import annotations
+import sqlite3
+import pytest
+
+from src.repositories.sqlite_subtask_repository import SQLiteSubtaskRepository
+from src.repositories.sqlite_project_repository import SQLiteProjectRepository
+
+
+def seed_project(conn, name: str = "Demo") -> int:
+    cur = conn.execute("INSERT INTO projects(name) VALUES(?)", (name,))
+    return int(cur.lastrowid)
+
+
+def seed_task(conn, project_id: int, phase_id: int = 1) -> int:
+    cur = conn.execute(
+        "INSERT INTO tasks(project_id, name, phase_id) VALUES(?,?,?)",
+        (project_id, "T", phase_id),
+    )
+    return int(cur.lastrowid)
+
+
+def seed_subtask(conn, task_id: int, phase_id: int = 1, updated_at_utc: str | None = None) -> int:
+    cur = conn.execute(
+        "INSERT INTO subtasks(task_id, name, phase_id, updated_at_utc) "
+        "VALUES(?,?,?,COALESCE(?, strftime('%Y-%m-%dT%H:%M:%SZ','now')))",
+        (task_id, "S", phase_id, updated_at_utc),
+    )
+    return int(cur.lastrowid)
+
+
+def subtask_state(conn, sid: int):
+    return conn.execute("SELECT phase_id, priority_id FROM subtasks WHERE id=?", (sid,)).fetchone()
+
+
+def update_count(conn, sid: int) -> int:
+    return conn.execute("SELECT COUNT(*) FROM subtask_updates WHERE subtask_id=?", (sid,)).fetchone()[0]
+
+# --- apply_subtask_changes ---------------------------------------------------
+
+def test_apply_subtask_changes_commits_phase_and_priority(db_conn):
+    tid = seed_task(db_conn, seed_project(db_conn))
+    sid = seed_subtask(db_conn, tid)
+    repo = SQLiteSubtaskRepository(db_conn)
+
+    assert repo.apply_subtask_changes(sid, phase_id=2, priority_id=3, note="both") is True
+    assert subtask_state(db_conn, sid) == (2, 3)
+    assert update_count(db_conn, sid) == 2
+    assert not db_conn.in_transaction
+
+
+def test_apply_subtask_changes_note_only(db_conn):
+    tid = seed_task(db_conn, seed_project(db_conn))
+    sid = seed_subtask(db_conn, tid)
+    repo = SQLiteSubtaskRepository(db_conn)
+
+    assert repo.apply_subtask_changes(sid, phase_id=1, priority_id=2, note="memo") is True
+    assert subtask_state(db_conn, sid) == (1, 2)
+    reason, note = db_conn.execute(
+        "SELECT reason, note FROM subtask_updates WHERE subtask_id=? ORDER BY id DESC LIMIT 1", (sid,)
+    ).fetchone()
+    assert (reason, note) == ("update", "memo")
+
+
+def test_apply_subtask_changes_rolls_back_on_failure(db_conn):
+    tid = seed_task(db_conn, seed_project(db_conn))
+    sid = seed_subtask(db_conn, tid, phase_id=2)
+    repo = SQLiteSubtaskRepository(db_conn)
+    before = update_count(db_conn, sid)
+
+    # 2 -> 1 is rejected by the phase trigger; the priority change must not survive it
+    with pytest.raises(sqlite3.IntegrityError):
+        repo.apply_subtask_changes(sid, phase_id=1, priority_id=4, note="nope")
+
+    assert not db_conn.in_transaction
+    assert subtask_state(db_conn, sid) == (2, 2)
+    assert update_count(db_conn, sid) == before
+
+
+def test_apply_subtask_changes_missing_id(db_conn):
+    repo = SQLiteSubtaskRepository(db_conn)
+
+    assert repo.apply_subtask_changes(9999, phase_id=2, priority_id=3, note="x") is False
+    assert update_count(db_conn, 9999) == 0
+    assert not db_conn.in_transaction
+
+# --- reads / field updates ---------------------------------------------------
+
+def test_get_subtask_with_history(db_conn):
+    tid = seed_task(db_conn, seed_project(db_conn))
+    sid = seed_subtask(db_conn, tid)
+    repo = SQLiteSubtaskRepository(db_conn)
+    repo.update_subtask_fields(sid, note="first")
+    repo.update_subtask_fields(sid, note="second")
+
+    rec, updates = repo.get_subtask_with_history(sid)
+    assert rec["id"] == sid and rec["task_id"] == tid
+    assert [u["note"] for u in updates] == ["second", "first"]   # newest first
+
+    assert repo.get_subtask_with_history(9999) == (None, [])
+
+
+def test_update_subtask_fields_reports_missing_rows(db_conn):
+    tid = seed_task(db_conn, seed_project(db_conn))
+    sid = seed_subtask(db_conn, tid)
+    repo = SQLiteSubtaskRepository(db_conn)
+
+    assert repo.update_subtask_fields(sid, name="Renamed") is True
+    assert db_conn.execute("SELECT name FROM subtasks WHERE id=?", (sid,)).fetchone()[0] == "Renamed"
+
+    assert repo.update_subtask_fields(9999, name="Ghost") is False
+    assert repo.update_subtask_fields(9999, note="ghost note") is False
+    assert update_count(db_conn, 9999) == 0
+
+# --- project listings --------------------------------------------------------
+
+def test_first_batch_plus_stream_returns_every_subtask_once(db_conn):
+    pid = seed_project(db_conn)
+    t1, t2, t_empty = seed_task(db_conn, pid), seed_task(db_conn, pid), seed_task(db_conn, pid)
+    other = seed_task(db_conn, seed_project(db_conn, "Other"))
+    # identical timestamps: only the id tiebreak orders these
+    same = "2024-01-01 00:00:00"
+    sids = [seed_subtask(db_conn, t1 if i % 2 else t2, updated_at_utc=same) for i in range(7)]
+    seed_subtask(db_conn, other, updated_at_utc=same)
+    repo = SQLiteSubtaskRepository(db_conn)
+
+    tasks, first, counts = repo.list_tasks_and_subtasks_for_project(pid, limit=3)
+    assert [tid for tid, _ in tasks] == [t1, t2, t_empty]
+    assert counts == {t1: 3, t2: 4, t_empty: 0}
+    assert len(first) == 3
+
+    streamed = [r for batch in repo.iter_subtasks_for_project(pid, offset=len(first), batch_size=2)
+                for r in batch]
+    ids = [r["id"] for r in first + streamed]
+    assert sorted(ids) == sorted(sids)
+    assert len(ids) == len(set(ids))
+    assert all(r["task_name"] == "T" for r in first + streamed)
+
+    # same order as the unbatched listing, ties included
+    assert ids == [r["id"] for r in repo.list_subtasks_for_project(pid, limit=100)]
+
+# --- project overview --------------------------------------------------------
+
+def test_get_project_overview(db_conn):
+    pid = seed_project(db_conn)
+    t_open, t_prog = seed_task(db_conn, pid, phase_id=1), seed_task(db_conn, pid, phase_id=2)
+    seed_task(db_conn, pid, phase_id=2)
+    seed_subtask(db_conn, t_open)
+    seed_subtask(db_conn, t_prog)
+    repo = SQLiteProjectRepository(db_conn)
+
+    ov = repo.get_project_overview(pid)
+    assert ov["tasks_total"] == 3
+    assert [ov[f"tasks_phase_{ph}"] for ph in range(1, 6)] == [1, 2, 0, 0, 0]
+    assert ov["subtasks_total"] == 2
+    # no project_updates yet: updated falls back to created
+    assert ov["updated_at_utc"] == ov["created_at_utc"]
+
+    assert repo.set_project_priority(pid, 3, note="bump")
+    assert repo.get_project_overview(pid)["updated_at_utc"] is not None
+
+    empty = repo.get_project_overview(seed_project(db_conn, "Empty"))
+    assert empty["tasks_total"] == 0 and empty["subtasks_total"] == 0
+    assert repo.get_project_overview(9999) is None
+
+# --- migration 0003 ----------------------------------------------------------
+
+def test_migration_0003_indexes(db_conn):
+    applied = {r[0] for r in db_conn.execute("SELECT filename FROM schema_migrations")}
+    assert "0003_indexes.sql" in applied
+
+    names = {r[0] for r in db_conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert {"idx_tasks_project_id_phase_id", "idx_subtasks_task_id"} <= names
+
+    plan = " ".join(str(r[-1]) for r in db_conn.execute(
+        "EXPLAIN QUERY PLAN SELECT phase_id, COUNT(*) FROM tasks WHERE project_id = ? GROUP BY phase_id", (1,)
+    ))
+    assert "idx_tasks_project_id_phase_id" in plan
@@ -0,0 +1,156 @@
+from __future__ import annotations
+import pytest
+
+from repositories.sqlite_subtask_repository import SQLiteSubtaskRepository
+from ui.tabs.subtasks_tab import SubtasksTab, _SubtasksModel
+
+
+def seed_project(conn, name: str = "Demo") -> int:
+    cur = conn.execute("INSERT INTO projects(name) VALUES(?)", (name,))
+    return int(cur.lastrowid)
+
+
+def seed_task(conn, project_id: int, name: str = "T") -> int:
+    cur = conn.execute("INSERT INTO tasks(project_id, name) VALUES(?,?)", (project_id, name))
+    return int(cur.lastrowid)
+
+
+def seed_subtasks(conn, task_id: int, n: int) -> None:
+    conn.executemany("INSERT INTO subtasks(task_id, name) VALUES(?,?)", [(task_id, f"S{i}") for i in range(n)])
+
+
+def shown_task_ids(tab: SubtasksTab) -> set:
+    return {row.get("task_id") for row in tab._model._rows}
+
+
+def select_task(tab: SubtasksTab, task_id) -> None:
+    tab._task_filter.setCurrentIndex(tab._task_filter.findData(task_id))
+    tab._filter_timer.stop()
+    tab._apply_filter()
+
+
+@pytest.fixture()
+def tab(qapp, db_conn):
+    t = SubtasksTab(SQLiteSubtaskRepository(db_conn))
+    yield t
+    t._stop_stream()
+    t.deleteLater()
+
+
+def test_rows_bucketed_by_task_for_the_filter(qapp, tab, db_conn):
+    pid = seed_project(db_conn)
+    t1, t2, t_empty = seed_task(db_conn, pid, "A"), seed_task(db_conn, pid, "B"), seed_task(db_conn, pid, "C")
+    seed_subtasks(db_conn, t1, 2)
+    seed_subtasks(db_conn, t2, 3)
+
+    tab.load(pid)
+    assert {tid: len(rows) for tid, rows in tab._rows_by_task.items()} == {t1: 2, t2: 3}
+    assert [tab._task_filter.itemText(i) for i in range(tab._task_filter.count())] == [
+        "All tasks (5)", "A (2)", "B (3)", "C (0)"]
+    assert tab._model.rowCount() == 5
+
+    select_task(tab, t2)
+    assert tab._model.rowCount() == 3 and shown_task_ids(tab) == {t2}
+
+    select_task(tab, t_empty)
+    assert tab._model.rowCount() == 0
+
+    select_task(tab, None)
+    assert tab._model.rowCount() == 5
+
+
+@pytest.fixture()
+def model(qapp):
+    m = _SubtasksModel()
+    log = []
+    m.rowsInserted.connect(lambda _p, a, b: log.append(("insert", a, b)))
+    m.rowsRemoved.connect(lambda _p, a, b: log.append(("remove", a, b)))
+    m.dataChanged.connect(lambda a, b, *_: log.append(("changed", a.row(), b.row())))
+    m.modelReset.connect(lambda: log.append(("reset",)))
+    return m, log
+
+
+def rows(*names: str) -> list:
+    return [{"id": i, "task_id": 1, "name": n} for i, n in enumerate(names, start=1)]
+
+
+def test_model_set_rows_recycles_rows(model):
+    m, log = model
+    names = {1: "A"}
+    m.set_rows(rows("a", "b"), names)
+    log.clear()
+
+    m.set_rows(rows("a", "b", "c"), names)
+    assert log == [("insert", 2, 2)]
+    log.clear()
+
+    m.set_rows(rows("a", "B", "c"), names)
+    assert log == [("changed", 1, 1)]
+    assert m.data(m.index(1, 2)) == "B"
+    log.clear()
+
+    m.set_rows(rows("a"), names)
+    assert log == [("remove", 1, 2)]
+    log.clear()
+
+    m.set_rows(rows("a"), dict(names))
+    assert log == []
+
+
+def test_model_set_rows_renamed_task_rewrites_every_row(model):
+    m, log = model
+    m.set_rows(rows("a", "b"), {1: "A"})
+    log.clear()
+
+    m.set_rows(rows("a", "b"), {1: "Renamed"})
+    assert log == [("changed", 0, 1)]
+    assert m.data(m.index(0, 1)) == "Renamed"
+
+
+def pump_stream(qapp, tab: SubtasksTab) -> None:
+    while tab._stream is not None:
+        qapp.processEvents()
+
+
+def test_rows_past_the_first_batch_stream_in(qapp, tab, db_conn):
+    pid = seed_project(db_conn)
+    t1, t2 = seed_task(db_conn, pid, "A"), seed_task(db_conn, pid, "B")
+    seed_subtasks(db_conn, t1, 400)
+    seed_subtasks(db_conn, t2, 400)
+
+    tab.load(pid)
+    assert tab._model.rowCount() == 500          # first batch, shown at once
+    assert tab._task_filter.itemText(0) == "All tasks (800)"
+    assert tab._stream is not None
+
+    pump_stream(qapp, tab)
+    assert tab._model.rowCount() == 800
+    ids = [tab._model.sid_at(r) for r in range(800)]
+    assert len(set(ids)) == 800
+    assert {tid: len(rs) for tid, rs in tab._rows_by_task.items()} == {t1: 400, t2: 400}
+
+
+def test_filter_chosen_mid_stream_gets_only_its_streamed_rows(qapp, tab, db_conn):
+    pid = seed_project(db_conn)
+    t1, t2 = seed_task(db_conn, pid, "A"), seed_task(db_conn, pid, "B")
+    seed_subtasks(db_conn, t1, 400)
+    seed_subtasks(db_conn, t2, 400)
+
+    tab.load(pid)
+    select_task(tab, t1)
+    pump_stream(qapp, tab)
+    assert tab._model.rowCount() == 400 and shown_task_ids(tab) == {t1}
+
+
+def test_reload_stops_the_previous_stream(qapp, tab, db_conn):
+    pid = seed_project(db_conn)
+    seed_subtasks(db_conn, seed_task(db_conn, pid), 700)
+    small = seed_project(db_conn, "Small")
+    seed_subtasks(db_conn, seed_task(db_conn, small), 3)
+
+    tab.load(pid)
+    assert tab._stream is not None
+    tab.load(small)
+    assert tab._stream is None
+    qapp.processEvents()
+    assert tab._model.rowCount() == 3
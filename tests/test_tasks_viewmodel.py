@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from repositories.sqlite_task_repository import SQLiteTaskRepository
+from viewmodels.tasks_viewmodel import TasksViewModel
+
+
+def seed_task(conn) -> tuple[int, int]:
+    pid = int(conn.execute("INSERT INTO projects(name) VALUES(?)", ("Demo",)).lastrowid)
+    tid = int(conn.execute("INSERT INTO tasks(project_id, name) VALUES(?,?)", (pid, "T")).lastrowid)
+    return pid, tid
+
+
+def reloads(vm: TasksViewModel) -> list:
+    seen = []
+    vm.tasksReloaded.connect(lambda total, rows: seen.append(total))
+    return seen
+
+
+def test_commands_coalesce_into_one_reload(qapp, db_conn):
+    pid, tid = seed_task(db_conn)
+    vm = TasksViewModel(SQLiteTaskRepository(db_conn))
+    vm.set_filters(pid)
+    seen = reloads(vm)
+
+    assert vm.update_task_fields(task_id=tid, name="Renamed")
+    assert vm.set_task_priority(task_id=tid, new_priority_id=3)
+    assert vm.update_task_fields(task_id=tid, note="memo")
+    assert seen == []   # queued, not run inline
+
+    qapp.processEvents()
+    assert seen == [1]
+    qapp.processEvents()
+    assert seen == [1]
+
+
+def test_explicit_reload_absorbs_a_pending_one(qapp, db_conn):
+    pid, tid = seed_task(db_conn)
+    vm = TasksViewModel(SQLiteTaskRepository(db_conn))
+    vm.set_filters(pid)
+    seen = reloads(vm)
+
+    assert vm.update_task_fields(task_id=tid, name="Renamed")
+    vm.reload()
+    qapp.processEvents()
+    assert seen == [1]